@@ -1,5 +1,38 @@
 # avl.py
+import bisect
 import json
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from collections import namedtuple
+from contextlib import contextmanager
+from operator import attrgetter
+
+try:
+    import orjson  # Codificador JSON en C, opcional
+except ImportError:
+    orjson = None
+
+# Registro inmutable con los datos de un producto, devuelto por las consultas del árbol.
+# Se accede por atributo (producto.precio) y se convierte a dict con `_asdict()`.
+Producto = namedtuple('Producto', 'clave nombre cantidad precio categoria')
+
+
+def _internar(categoria):
+    """
+    Retorna la copia compartida de una categoría de texto.
+
+    Hay pocas categorías distintas: internarlas hace que cada una se guarde una sola
+    vez y que las comparaciones por igualdad se resuelvan por identidad. Los valores
+    que no son texto (por ejemplo `null` en el JSON) se guardan tal cual, como antes.
+
+    :param categoria: Categoría del producto.
+    :return: La categoría, internada si es una cadena.
+    """
+    return sys.intern(categoria) if isinstance(categoria, str) else categoria
+
 
 class NodoAVL:
     """
@@ -11,19 +44,31 @@ class NodoAVL:
             precio (float): El precio del producto en el nodo.
             categoria (str): La categoría del producto en el nodo.
             altura (int): La altura del nodo en el árbol.
+            balance (int): Factor de balance (altura izquierda - altura derecha).
             izquierda (NodoAVL): Referencia al nodo hijo izquierdo.
             derecha (NodoAVL): Referencia al nodo hijo derecho.S
     """
+    # Atributos fijos: sin __dict__ por instancia, menos memoria y acceso más rápido
+    __slots__ = ('clave', 'nombre', 'cantidad', 'precio', 'categoria',
+                 'altura', 'balance', 'izquierda', 'derecha')
+
     def __init__(self, clave, nombre, cantidad, precio, categoria):
         self.clave = clave
         self.nombre = nombre
         self.cantidad = cantidad
         self.precio = precio
-        self.categoria = categoria
+        self.categoria = _internar(categoria)
         self.altura = 1
+        self.balance = 0
         self.izquierda = None
         self.derecha = None 
 
+    def como_producto(self):
+        """
+        Retorna los datos del nodo como un registro `Producto`.
+        """
+        return Producto(self.clave, self.nombre, self.cantidad, self.precio, self.categoria)
+
 
 class AVLTree:
     """
@@ -31,19 +76,52 @@ class AVLTree:
 
     Atributos:
         raiz (NodoAVL): La raíz del árbol AVL.
-        rotation_callback (función): Callback para notificar rotaciones.
+        rotation_callback (función): Callback para notificar rotaciones. Se llama una
+            vez por rotación, pero al terminar la inserción o eliminación completa.
+            Dentro de `bulk_update` no se notifican rotaciones.
         json_file (str): Ruta del archivo JSON para guardar la información.
-        rotations_performed (list): Lista de rotaciones realizadas.
+        rotations_performed (list): Rotaciones de la última eliminación, como tuplas
+            (tipo_rotacion, clave); ver `formatear_rotaciones`.
+        _category_index (dict): Índice secundario categoría -> claves ordenadas.
+        _price_index (list): Índice secundario de tuplas (precio, clave) ordenadas.
+        _by_key (dict): Índice clave -> nodo para consultas puntuales en O(1).
+        _out_of_stock_index (list): Índice secundario de claves sin stock, ordenadas.
+        _search_cache (dict): Últimos resultados de `buscar` (LRU pequeño).
+        _inorder_cache (tuple): Último resultado de `in_order_traversal`, o None si el
+            árbol cambió desde entonces.
+
+    Persistencia: si hay un archivo JSON asignado, cada modificación se agrega como
+    una línea al journal `<archivo>.journal` en lugar de reescribir todo el árbol.
+    Cada `JOURNAL_COMPACT_EVERY` cambios (y siempre en `guardar_en_json`) se escribe
+    la instantánea completa y se borra el journal; `cargar_desde_json` vuelve a
+    aplicar el journal pendiente. Para agrupar varias modificaciones en una sola
+    escritura de la instantánea se usa `bulk_update`.
     """
     
+    # Cantidad máxima de búsquedas recientes que guarda `buscar`
+    SEARCH_CACHE_SIZE = 8
+
+    # Cambios registrados en el journal antes de reescribir la instantánea completa
+    JOURNAL_COMPACT_EVERY = 100
+
     def __init__(self):
         """
         Inicializa un árbol AVL vacío.
         """
         self.raiz = None
         self.rotation_callback = None  # Callback para rotaciones
+        self._rotation_buffer = [] # Rotaciones pendientes de notificar al callback
         self.json_file = None # Archivo JSON para guardar la información
         self.rotations_performed = [] # Lista de rotaciones realizadas
+        self._bulk_depth = 0 # Nivel de anidamiento de bulk_update
+        self._dirty = False # Hay cambios sin escribir en el JSON
+        self._journal_ops = None # Cambios en el journal; None si falta la instantánea inicial
+        self._category_index = {} # categoria -> lista ordenada de claves
+        self._price_index = [] # (precio, clave) ordenados por precio
+        self._by_key = {} # clave -> NodoAVL
+        self._out_of_stock_index = [] # claves con cantidad 0, ordenadas
+        self._search_cache = {} # clave -> (resultado, camino) de búsquedas recientes
+        self._inorder_cache = None # Productos en orden; None si hay que recorrer el árbol
         
         
     def set_json_file(self, file_path):
@@ -54,6 +132,7 @@ class AVLTree:
             file_path (str): La ruta del archivo JSON.
         """
         self.json_file = file_path
+        self._journal_ops = None # El primer cambio escribe la instantánea completa
 
 
     def set_rotation_callback(self, callback):
@@ -93,7 +172,7 @@ class AVLTree:
         """
         if not nodo:
             return 0
-        return self.obtener_altura(nodo.izquierda) - self.obtener_altura(nodo.derecha)
+        return nodo.balance
 
 
     def rotacion_derecha(self, y):
@@ -109,7 +188,7 @@ class AVLTree:
     Funcionamiento:
         1. Se guarda el hijo izquierdo de y en x.
         2. Se guarda el hijo derecho de x en T2.
-        3. Si hay un callback de rotación definido, se notifica la rotación.
+        3. Si hay un callback de rotación definido, se encola la notificación.
         4. Se realiza la rotación:
             - El hijo derecho de x se convierte en y.
             - El hijo izquierdo de y se convierte en T2.
@@ -119,19 +198,24 @@ class AVLTree:
         x = y.izquierda
         T2 = x.derecha
 
-        # Notificar la rotación
-        if self.rotation_callback:
-            self.rotation_callback("rotacion_derecha", y.clave, x.clave)
+        # Encolar la notificación; se entrega en `_notificar_rotaciones`
+        if self.rotation_callback and not self._bulk_depth:
+            self._rotation_buffer.append(("rotacion_derecha", y.clave, x.clave))
 
         # Realizar rotación
         x.derecha = y
         y.izquierda = T2
 
-        # Actualizar alturas
-        y.altura = 1 + max(self.obtener_altura(y.izquierda),
-                           self.obtener_altura(y.derecha))
-        x.altura = 1 + max(self.obtener_altura(x.izquierda),
-                           self.obtener_altura(x.derecha))
+        # Actualizar alturas y balances (se lee `altura` directamente; un hijo vacío
+        # mide 0). Se usa una condicional en vez de max() para evitar la llamada
+        hl = T2.altura if T2 else 0
+        hr = y.derecha.altura if y.derecha else 0
+        y.altura = hl + 1 if hl >= hr else hr + 1
+        y.balance = hl - hr
+        hl = x.izquierda.altura if x.izquierda else 0
+        hr = y.altura
+        x.altura = hl + 1 if hl >= hr else hr + 1
+        x.balance = hl - hr
         return x
 
 
@@ -148,7 +232,7 @@ class AVLTree:
     Funcionamiento:
         1. Se guarda el hijo derecho de x en y.
         2. Se guarda el hijo izquierdo de y en T2.
-        3. Si hay un callback de rotación definido, se notifica la rotación.
+        3. Si hay un callback de rotación definido, se encola la notificación.
         4. Se realiza la rotación:
             - El hijo izquierdo de y se convierte en x.
             - El hijo derecho de x se convierte en T2.
@@ -158,19 +242,24 @@ class AVLTree:
         y = x.derecha
         T2 = y.izquierda
 
-        # Notificar la rotación
-        if self.rotation_callback:
-            self.rotation_callback("rotacion_izquierda", x.clave, y.clave)
+        # Encolar la notificación; se entrega en `_notificar_rotaciones`
+        if self.rotation_callback and not self._bulk_depth:
+            self._rotation_buffer.append(("rotacion_izquierda", x.clave, y.clave))
 
         # Realizar rotación
         y.izquierda = x
         x.derecha = T2
 
-        # Actualizar alturas
-        x.altura = 1 + max(self.obtener_altura(x.izquierda),
-                           self.obtener_altura(x.derecha))
-        y.altura = 1 + max(self.obtener_altura(y.izquierda),
-                           self.obtener_altura(y.derecha))
+        # Actualizar alturas y balances (se lee `altura` directamente; un hijo vacío
+        # mide 0). Se usa una condicional en vez de max() para evitar la llamada
+        hl = x.izquierda.altura if x.izquierda else 0
+        hr = T2.altura if T2 else 0
+        x.altura = hl + 1 if hl >= hr else hr + 1
+        x.balance = hl - hr
+        hl = x.altura
+        hr = y.derecha.altura if y.derecha else 0
+        y.altura = hl + 1 if hl >= hr else hr + 1
+        y.balance = hl - hr
         return y
 
 
@@ -191,22 +280,31 @@ class AVLTree:
         :return: Nueva raíz del subárbol.
         """
         # Verifica si la clave ya existe en el árbol
-        if self.buscar(clave)[0]:
+        if self.contiene(clave):
             # Si la clave ya existe, lanza una excepción
             raise ValueError(f"La clave {clave} ya existe en el árbol.")
-        # Inserta el nuevo nodo en el árbol
+        # Inserta el nuevo nodo en el árbol; los caminos guardados dejan de ser válidos
+        self._search_cache.clear()
+        self._inorder_cache = None
         self.raiz = self._insertar(self.raiz, clave, nombre, cantidad, precio, categoria)
+        self._notificar_rotaciones()
         # Actualiza la representación del árbol en un archivo JSON
-        self._actualizar_json()
+        self._actualizar_json({
+            "op": "insertar",
+            "producto": Producto(clave, nombre, cantidad, precio, categoria)._asdict()
+        })
 
 
     def _insertar(self, nodo, clave, nombre, cantidad, precio, categoria):
         """
         Inserta un nuevo nodo en el subárbol con raíz en nodo.
 
-        Esta función realiza la inserción estándar en un árbol binario de búsqueda (BST).
-        Luego, actualiza la altura del nodo ancestro y verifica si el subárbol se ha 
-        desbalanceado. Si es así, realiza las rotaciones necesarias para balancear el árbol.
+        Esta función realiza la inserción estándar en un árbol binario de búsqueda (BST)
+        de forma iterativa: desciende guardando los ancestros en una pila y luego la
+        recorre de regreso actualizando la altura de cada ancestro y verificando si el
+        subárbol se ha desbalanceado. Si es así, realiza las rotaciones necesarias para
+        balancear el árbol. Si la altura de un ancestro no cambia, ninguno de los que
+        están más arriba puede cambiar y el ascenso se detiene ahí.
 
         :param nodo: Nodo raíz del subárbol.
         :param clave: Clave única del nodo.
@@ -216,52 +314,62 @@ class AVLTree:
         :param categoria: Categoría asociada al nodo.
         :return: Nueva raíz del subárbol.
         """
-        
-        # Inserción estándar en BST
-        if not nodo:
-            # Si el nodo es None, crea un nuevo nodo y lo retorna
-            return NodoAVL(clave, nombre, cantidad, precio, categoria)
-        elif clave < nodo.clave:
-            # Si el nodo es None, crea un nuevo nodo y lo retorna
-            nodo.izquierda = self._insertar(nodo.izquierda, clave, nombre, cantidad, precio, categoria)
-        elif clave > nodo.clave:
-            # Si la clave es mayor que la clave del nodo actual, inserta en el subárbol derecho
-            nodo.derecha = self._insertar(nodo.derecha, clave, nombre, cantidad, precio, categoria)
-        else:
-            # Si la clave ya existe, actualiza la información del nodo
-            nodo.nombre = nombre
-            nodo.cantidad = cantidad
-            nodo.precio = precio
-            nodo.categoria = categoria
-            return nodo
-
-        # Actualiza la altura del nodo ancestro
-        nodo.altura = 1 + max(self.obtener_altura(nodo.izquierda),
-                              self.obtener_altura(nodo.derecha))
-
-        # Obtener el factor de balance
-        balance = self.obtener_balance(nodo)
-
-        # Balancear el árbol
-        # Caso Izquierda Izquierda
-        if balance > 1 and clave < nodo.izquierda.clave:
-            return self.rotacion_derecha(nodo)
-
-        # Caso Derecha Derecha
-        if balance < -1 and clave > nodo.derecha.clave:
-            return self.rotacion_izquierda(nodo)
+        # Descenso estándar en BST guardando los ancestros. `insertar` ya descartó las
+        # claves repetidas, así que el descenso siempre termina en una posición vacía
+        ancestros = []
+        actual = nodo
+        while actual:
+            ancestros.append(actual)
+            actual = actual.izquierda if clave < actual.clave else actual.derecha
+
+        # El nuevo nodo ocupa la posición vacía encontrada
+        subarbol = NodoAVL(clave, nombre, cantidad, precio, categoria)
+        self._by_key[clave] = subarbol
+        self._indexar_categoria(categoria, clave)
+        bisect.insort(self._price_index, (precio, clave))
+        if cantidad == 0:
+            bisect.insort(self._out_of_stock_index, clave)
+
+        # Ascenso: reenganchar cada subárbol y balancear sus ancestros
+        while ancestros:
+            padre = ancestros.pop()
+            if clave < padre.clave:
+                padre.izquierda = subarbol
+            else:
+                padre.derecha = subarbol
+
+            # Actualiza la altura del nodo ancestro y obtiene el factor de balance
+            # a partir de las mismas alturas de los hijos
+            altura_anterior = padre.altura
+            izquierda, derecha = padre.izquierda, padre.derecha
+            hl = izquierda.altura if izquierda else 0
+            hr = derecha.altura if derecha else 0
+            padre.altura = hl + 1 if hl >= hr else hr + 1
+            padre.balance = balance = hl - hr
+            if padre.altura == altura_anterior:
+                # La altura no cambió (y el nodo quedó balanceado): el resto del
+                # camino ya está enganchado y balanceado, la raíz no cambia
+                return nodo
+
+            # Balancear el árbol: el balance del hijo decide si es rotación simple o doble
+            if balance > 1:
+                # Caso Izquierda Derecha: primero se rota el hijo izquierdo
+                if padre.izquierda.balance < 0:
+                    padre.izquierda = self.rotacion_izquierda(padre.izquierda)
+                # Caso Izquierda Izquierda
+                subarbol = self.rotacion_derecha(padre)
+
+            elif balance < -1:
+                # Caso Derecha Izquierda: primero se rota el hijo derecho
+                if padre.derecha.balance > 0:
+                    padre.derecha = self.rotacion_derecha(padre.derecha)
+                # Caso Derecha Derecha
+                subarbol = self.rotacion_izquierda(padre)
 
-        # Caso Izquierda Derecha
-        if balance > 1 and clave > nodo.izquierda.clave:
-            nodo.izquierda = self.rotacion_izquierda(nodo.izquierda)
-            return self.rotacion_derecha(nodo)
+            else:
+                subarbol = padre
 
-        # Caso Derecha Izquierda
-        if balance < -1 and clave < nodo.derecha.clave:
-            nodo.derecha = self.rotacion_derecha(nodo.derecha)
-            return self.rotacion_izquierda(nodo)
-
-        return nodo
+        return subarbol
 
 
     def actualizar_producto(self, clave, nueva_cantidad=None, nuevo_precio=None):
@@ -271,33 +379,26 @@ class AVLTree:
         :param clave: Clave del producto a actualizar.
         :param nueva_cantidad: Nueva cantidad del producto (opcional).
         :param nuevo_precio: Nuevo precio del producto (opcional).
+        :return: True si se actualizó el producto, None si no se encontró.
         """
-        
-        def _actualizar_recursivo(nodo):
-            """
-            Función recursiva para buscar y actualizar el producto en el árbol.
-
-            :param nodo: Nodo actual en el recorrido del árbol.
-            :return: True si se actualizó el producto, None si no se encontró.
-            """
-            if not nodo:
-                return None
-            
-            if clave == nodo.clave:
-                if nueva_cantidad is not None:
-                    nodo.cantidad = nueva_cantidad
-                if nuevo_precio is not None:
-                    nodo.precio = nuevo_precio
-                return True
-            elif clave < nodo.clave:
-                return _actualizar_recursivo(nodo.izquierda)
-            else:
-                return _actualizar_recursivo(nodo.derecha)
-
-        resultado = _actualizar_recursivo(self.raiz)
-        if resultado:
-            self._actualizar_json()
-        return resultado
+        nodo = self._obtener_nodo(clave)
+        if not nodo:
+            return None
+
+        if nueva_cantidad is not None:
+            self._reindexar_stock(clave, nodo.cantidad, nueva_cantidad)
+            nodo.cantidad = nueva_cantidad
+        if nuevo_precio is not None and nuevo_precio != nodo.precio:
+            self._desindexar_precio(nodo.precio, clave)
+            bisect.insort(self._price_index, (nuevo_precio, clave))
+            nodo.precio = nuevo_precio
+        # La forma del árbol no cambia: solo se descarta la búsqueda de esta clave
+        self._search_cache.pop(clave, None)
+        self._inorder_cache = None
+        self._actualizar_json({
+            "op": "actualizar", "clave": clave, "cantidad": nueva_cantidad, "precio": nuevo_precio
+        })
+        return True
 
 
     def min_valor_nodo(self, nodo):
@@ -318,143 +419,359 @@ class AVLTree:
         Elimina un nodo con la clave dada del árbol AVL y actualiza el archivo JSON.
 
         :param clave: Clave del nodo a eliminar.
-        :return: Lista de rotaciones realizadas durante la eliminación.
+        :return: Lista de rotaciones realizadas durante la eliminación, como tuplas
+            (tipo_rotacion, clave). El texto se obtiene con `formatear_rotaciones`.
         """
         self.rotations_performed = [] # Limpiar lista de rotaciones
+        if clave not in self._by_key:
+            # La clave no existe: no hay nada que eliminar ni que guardar
+            return self.rotations_performed
+        self._search_cache.clear()
+        self._inorder_cache = None
         self.raiz = self._eliminar(self.raiz, clave)
-        self._actualizar_json()
+        self._notificar_rotaciones()
+        self._actualizar_json({"op": "eliminar", "clave": clave})
         return self.rotations_performed # Retornar lista de rotaciones realizadas
 
+    def _notificar_rotaciones(self):
+        """
+        Entrega al callback las rotaciones acumuladas durante la última operación.
+
+        Las rotaciones se encolan mientras se balancea el árbol y se notifican aquí,
+        en el mismo orden, cuando el árbol ya quedó consistente; así un callback lento
+        (por ejemplo uno que redibuja la interfaz) no interrumpe el balanceo.
+        """
+        if not self._rotation_buffer:
+            return
+        rotaciones, self._rotation_buffer = self._rotation_buffer, []
+        if self.rotation_callback:
+            for tipo, clave_y, clave_x in rotaciones:
+                self.rotation_callback(tipo, clave_y, clave_x)
+
+    def formatear_rotaciones(self, rotaciones=None):
+        """
+        Convierte las rotaciones registradas en textos descriptivos.
+
+        El texto se arma solo cuando alguien lo necesita, no durante el balanceo.
+
+        :param rotaciones: Lista de tuplas (tipo_rotacion, clave); por defecto las de
+            la última eliminación.
+        :return: Lista de cadenas como "Rotación Derecha en nodo 5".
+        """
+        if rotaciones is None:
+            rotaciones = self.rotations_performed
+        return [
+            f"Rotación {'Derecha' if tipo == 'rotacion_derecha' else 'Izquierda'} en nodo {clave}"
+            for tipo, clave in rotaciones
+        ]
+
     def _eliminar(self, nodo, clave):
         """
-        Función recursiva para eliminar un nodo del árbol AVL.
+        Elimina de forma iterativa un nodo del árbol AVL.
+
+        Desciende guardando en una pila cada ancestro junto con el lado por el que se
+        bajó, retira el nodo (si tiene dos hijos, su sucesor in-order pasa a ocupar su
+        lugar) y luego recorre la pila de regreso reenganchando y balanceando cada ancestro.
+        El ascenso se detiene en cuanto un ancestro conserva su altura sin rotar, una vez
+        que el reemplazo del nodo eliminado ya quedó enganchado.
 
-        :param nodo: Nodo actual en el recorrido del árbol.
+        :param nodo: Nodo raíz del subárbol.
         :param clave: Clave del nodo a eliminar.
         :return: Nodo raíz del subárbol modificado.
         """
-        if not nodo:
+        # Descenso guardando (ancestro, bajó_por_la_izquierda)
+        ancestros = []
+        actual = nodo
+        while actual and clave != actual.clave:
+            if clave < actual.clave:
+                ancestros.append((actual, True))
+                actual = actual.izquierda
+            else:
+                ancestros.append((actual, False))
+                actual = actual.derecha
+
+        if not actual:
             return nodo
 
-        if clave < nodo.clave:
-            nodo.izquierda = self._eliminar(nodo.izquierda, clave)
-        elif clave > nodo.clave:
-            nodo.derecha = self._eliminar(nodo.derecha, clave)
+        self._desindexar_categoria(actual.categoria, actual.clave)
+        self._desindexar_precio(actual.precio, actual.clave)
+        if actual.cantidad == 0:
+            self._reindexar_stock(actual.clave, 0, None)
+        del self._by_key[actual.clave]
+        # Los ancestros por encima del padre del nodo eliminado permiten detener el ascenso
+        profundidad = len(ancestros)
+
+        if actual.izquierda and actual.derecha:
+            # Dos hijos: el sucesor in-order ocupa el lugar del nodo eliminado.
+            # Se reenganchan punteros en lugar de copiar los datos, así cada nodo
+            # conserva su identidad (y su entrada en `_by_key`).
+            cadena = []
+            sucesor = actual.derecha
+            while sucesor.izquierda:
+                cadena.append((sucesor, True))
+                sucesor = sucesor.izquierda
+            subarbol = sucesor.derecha
+            sucesor.izquierda = actual.izquierda
+            if cadena:
+                sucesor.derecha = actual.derecha
+            ancestros.append((sucesor, False))
+            ancestros.extend(cadena)
         else:
-            if not nodo.izquierda:
-                return nodo.derecha
-            elif not nodo.derecha:
-                return nodo.izquierda
-
-            temp = self.min_valor_nodo(nodo.derecha)
-            nodo.clave = temp.clave
-            nodo.nombre = temp.nombre
-            nodo.cantidad = temp.cantidad
-            nodo.precio = temp.precio
-            nodo.categoria = temp.categoria
-            nodo.derecha = self._eliminar(nodo.derecha, temp.clave)
+            subarbol = actual.izquierda or actual.derecha
+        actual.izquierda = actual.derecha = None
+
+        # Ascenso: reenganchar cada subárbol y balancear sus ancestros
+        while ancestros:
+            padre, por_izquierda = ancestros.pop()
+            if por_izquierda:
+                padre.izquierda = subarbol
+            else:
+                padre.derecha = subarbol
+
+            altura_anterior = padre.altura
+            izquierda, derecha = padre.izquierda, padre.derecha
+            hl = izquierda.altura if izquierda else 0
+            hr = derecha.altura if derecha else 0
+            padre.altura = hl + 1 if hl >= hr else hr + 1
+            padre.balance = balance = hl - hr
+
+            # El balance guardado del hijo decide si es rotación simple o doble
+            if balance > 1:
+                # Caso Izquierda Derecha: primero se rota el hijo izquierdo
+                if padre.izquierda.balance < 0:
+                    self.rotations_performed.append(("rotacion_izquierda", padre.izquierda.clave))
+                    padre.izquierda = self.rotacion_izquierda(padre.izquierda)
+                # Caso Izquierda Izquierda
+                self.rotations_performed.append(("rotacion_derecha", padre.clave))
+                subarbol = self.rotacion_derecha(padre)
+
+            elif balance < -1:
+                # Caso Derecha Izquierda: primero se rota el hijo derecho
+                if padre.derecha.balance > 0:
+                    self.rotations_performed.append(("rotacion_derecha", padre.derecha.clave))
+                    padre.derecha = self.rotacion_derecha(padre.derecha)
+                # Caso Derecha Derecha
+                self.rotations_performed.append(("rotacion_izquierda", padre.clave))
+                subarbol = self.rotacion_izquierda(padre)
+
+            elif padre.altura == altura_anterior and len(ancestros) < profundidad:
+                # Sin rotación ni cambio de altura: los ancestros restantes no cambian
+                return nodo
 
-        if not nodo:
-            return nodo
+            else:
+                subarbol = padre
 
-        nodo.altura = 1 + max(self.obtener_altura(nodo.izquierda),
-                              self.obtener_altura(nodo.derecha))
+        return subarbol
 
-        balance = self.obtener_balance(nodo)
 
-        # Caso Izquierda Izquierda
-        if balance > 1 and self.obtener_balance(nodo.izquierda) >= 0:
-            self.rotations_performed.append(f"Rotación Derecha en nodo {nodo.clave}")
-            return self.rotacion_derecha(nodo)
+    def _indexar_categoria(self, categoria, clave):
+        """
+        Agrega una clave al índice secundario de su categoría, manteniéndolo ordenado.
 
-        # Caso Izquierda Derecha
-        if balance > 1 and self.obtener_balance(nodo.izquierda) < 0:
-            self.rotations_performed.append(f"Rotación Izquierda en nodo {nodo.izquierda.clave}")
-            self.rotations_performed.append(f"Rotación Derecha en nodo {nodo.clave}")
-            nodo.izquierda = self.rotacion_izquierda(nodo.izquierda)
-            return self.rotacion_derecha(nodo)
+        :param categoria: Categoría del producto.
+        :param clave: Clave del producto.
+        """
+        bisect.insort(self._category_index.setdefault(_internar(categoria), []), clave)
 
-        # Caso Derecha Derecha
-        if balance < -1 and self.obtener_balance(nodo.derecha) <= 0:
-            self.rotations_performed.append(f"Rotación Izquierda en nodo {nodo.clave}")
-            return self.rotacion_izquierda(nodo)
 
-        # Caso Derecha Izquierda
-        if balance < -1 and self.obtener_balance(nodo.derecha) > 0:
-            self.rotations_performed.append(f"Rotación Derecha en nodo {nodo.derecha.clave}")
-            self.rotations_performed.append(f"Rotación Izquierda en nodo {nodo.clave}")
-            nodo.derecha = self.rotacion_derecha(nodo.derecha)
-            return self.rotacion_izquierda(nodo)
+    def _desindexar_categoria(self, categoria, clave):
+        """
+        Retira una clave del índice secundario de su categoría.
 
-        return nodo
+        :param categoria: Categoría del producto.
+        :param clave: Clave del producto.
+        """
+        claves = self._category_index.get(categoria)
+        if not claves:
+            return
+        i = bisect.bisect_left(claves, clave)
+        if i < len(claves) and claves[i] == clave:
+            del claves[i]
+        if not claves:
+            del self._category_index[categoria]
+
+
+    def _desindexar_precio(self, precio, clave):
+        """
+        Retira la entrada (precio, clave) del índice secundario de precios.
+
+        :param precio: Precio registrado del producto.
+        :param clave: Clave del producto.
+        """
+        i = bisect.bisect_left(self._price_index, (precio, clave))
+        if i < len(self._price_index) and self._price_index[i] == (precio, clave):
+            del self._price_index[i]
+
+
+    def _reindexar_stock(self, clave, cantidad_anterior, cantidad_nueva):
+        """
+        Mantiene el índice de productos sin stock cuando cambia la cantidad de uno.
+
+        :param clave: Clave del producto.
+        :param cantidad_anterior: Cantidad registrada hasta ahora.
+        :param cantidad_nueva: Nueva cantidad, o None si el producto se elimina.
+        """
+        estaba_agotado = cantidad_anterior == 0
+        queda_agotado = cantidad_nueva == 0
+        if estaba_agotado == queda_agotado:
+            return
+        if queda_agotado:
+            bisect.insort(self._out_of_stock_index, clave)
+            return
+        claves = self._out_of_stock_index
+        i = bisect.bisect_left(claves, clave)
+        if i < len(claves) and claves[i] == clave:
+            del claves[i]
+
+
+    def _obtener_nodo(self, clave):
+        """
+        Obtiene el nodo con la clave dada en O(1) usando el índice `_by_key`,
+        sin recorrer el árbol.
+
+        :param clave: Clave del nodo a obtener.
+        :return: El nodo encontrado, o None si la clave no existe.
+        """
+        return self._by_key.get(clave)
+
+
+    def contiene(self, clave):
+        """
+        Indica si existe un nodo con la clave dada en el árbol AVL.
+
+        A diferencia de `buscar`, no construye el `Producto` encontrado ni el
+        camino recorrido.
+
+        :param clave: Clave del nodo a verificar.
+        :return: True si la clave existe, False en caso contrario.
+        """
+        return self._obtener_nodo(clave) is not None
+
+
+    def __contains__(self, clave):
+        """
+        Permite escribir `clave in arbol`; equivale a `contiene`.
+
+        :param clave: Clave del nodo a verificar.
+        :return: True si la clave existe, False en caso contrario.
+        """
+        return clave in self._by_key
+
+
+    def __getitem__(self, clave):
+        """
+        Permite escribir `arbol[clave]` para obtener un producto en O(1) con `_by_key`,
+        sin recorrer el árbol ni registrar el camino.
+
+        :param clave: Clave del producto.
+        :return: `Producto` con los datos del nodo.
+        :raises KeyError: Si la clave no existe en el árbol.
+        """
+        nodo = self._by_key.get(clave)
+        if nodo is None:
+            raise KeyError(clave)
+        return nodo.como_producto()
 
 
     def buscar(self, clave):
         """
         Busca un nodo con la clave dada en el árbol AVL.
 
+        Las últimas `SEARCH_CACHE_SIZE` búsquedas se guardan, así que repetir la
+        búsqueda de una clave (por ejemplo buscar, actualizar y volver a buscar desde la
+        interfaz) no recorre el árbol de nuevo. Insertar, eliminar o cargar datos vacía
+        el caché, porque cambian los caminos; actualizar un producto solo descarta su clave.
+
+        Para solo saber si una clave existe conviene `contiene`, que no arma el
+        resultado ni el camino.
+
         :param clave: Clave del nodo a buscar.
-        :return: Diccionario con los datos del nodo encontrado y el camino recorrido.
+        :return: `Producto` con los datos del nodo encontrado (o None) y el camino
+            recorrido, como tupla de claves.
         """
-        return self._buscar(self.raiz, clave, [])
+        cache = self._search_cache
+        if clave in cache:
+            # Mover al final para mantener el orden de uso reciente
+            resultado = cache[clave] = cache.pop(clave)
+        else:
+            resultado, camino = self._buscar(self.raiz, clave, [])
+            # Ambos valores son inmutables, así que se entregan tal cual en cada acierto
+            resultado = cache[clave] = (resultado, tuple(camino))
+            if len(cache) > self.SEARCH_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return resultado
 
 
     def _buscar(self, nodo, clave, camino):
         """
-        Función recursiva para buscar un nodo en el árbol AVL.
+        Busca de forma iterativa un nodo en el árbol AVL.
 
-        :param nodo: Nodo actual en el recorrido del árbol.
+        :param nodo: Nodo desde el cual comenzar la búsqueda.
         :param clave: Clave del nodo a buscar.
         :param camino: Lista que almacena el camino recorrido.
-        :return: Diccionario con los datos del nodo encontrado y el camino recorrido.
+        :return: `Producto` con los datos del nodo encontrado (o None) y el camino recorrido.
         """
-        if not nodo:
-            return None, camino
-        
-        camino.append(nodo.clave)
-        
-        if clave == nodo.clave:
-            return {
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            }, camino
-        elif clave < nodo.clave:
-            return self._buscar(nodo.izquierda, clave, camino)
-        else:
-            return self._buscar(nodo.derecha, clave, camino)
+        # Se enlaza `append` y se lee `nodo.clave` una sola vez por nivel
+        agregar = camino.append
+        while nodo:
+            clave_nodo = nodo.clave
+            agregar(clave_nodo)
+
+            if clave == clave_nodo:
+                return nodo.como_producto(), camino
+            nodo = nodo.izquierda if clave < clave_nodo else nodo.derecha
+
+        return None, camino
 
 
     def in_order_traversal(self):
         """
         Realiza un recorrido in-order del árbol AVL.
 
-        :return: Lista de diccionarios con los datos de los nodos en orden.
+        El resultado se guarda hasta la siguiente modificación del árbol, así que
+        llamadas repetidas sin cambios intermedios no vuelven a recorrerlo. Por eso el
+        resultado es una tupla: se comparte entre quienes lo piden y nadie puede
+        modificarlo.
+
+        :return: Tupla de `Producto` con los datos de los nodos en orden.
         """
-        elementos = []
-        self._in_order_traversal(self.raiz, elementos)
-        return elementos
+        if self._inorder_cache is None:
+            elementos = []
+            self._in_order_traversal(self.raiz, elementos)
+            self._inorder_cache = tuple(elementos)
+        return self._inorder_cache
 
 
     def _in_order_traversal(self, nodo, elementos):
         """
-        Función recursiva para realizar un recorrido in-order del árbol AVL.
+        Realiza un recorrido in-order de Morris del árbol AVL.
 
-        :param nodo: Nodo actual en el recorrido del árbol.
+        No usa pila ni recursión: antes de bajar a la izquierda, enlaza temporalmente
+        el predecesor in-order del nodo actual con el nodo, y deshace el enlace al
+        regresar. Al terminar el recorrido el árbol queda exactamente como estaba, por
+        eso el recorrido siempre se completa dentro de esta función.
+
+        :param nodo: Nodo raíz del recorrido.
         :param elementos: Lista que almacena los datos de los nodos en orden.
         """
-        if nodo:
-            self._in_order_traversal(nodo.izquierda, elementos)
-            elementos.append({
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            })
-            self._in_order_traversal(nodo.derecha, elementos)
+        while nodo:
+            if nodo.izquierda:
+                # Buscar el predecesor in-order de nodo
+                predecesor = nodo.izquierda
+                while predecesor.derecha and predecesor.derecha is not nodo:
+                    predecesor = predecesor.derecha
+
+                if predecesor.derecha is None:
+                    # Primera visita: enlazar y bajar a la izquierda
+                    predecesor.derecha = nodo
+                    nodo = nodo.izquierda
+                    continue
+
+                # Segunda visita: el subárbol izquierdo ya se recorrió
+                predecesor.derecha = None
+
+            elementos.append(nodo.como_producto())
+            nodo = nodo.derecha
             
             
             
@@ -462,130 +779,339 @@ class AVLTree:
         """
         Carga los datos del árbol AVL desde un archivo JSON.
 
+        Equivale a `cargar_datos(leer_json(archivo_json), archivo_json)`; las dos partes
+        están separadas para que la lectura del archivo pueda hacerse fuera del hilo
+        que modifica el árbol.
+
+        :param archivo_json: Ruta del archivo JSON.
+        :raises ValueError: Si alguna clave está repetida en el archivo o ya existe en el árbol.
+        """
+        self.cargar_datos(self.leer_json(archivo_json), archivo_json)
+
+
+    def leer_json(self, archivo_json):
+        """
+        Lee y decodifica un archivo JSON de productos sin modificar el árbol.
+
+        Si `orjson` está instalado, el archivo se mapea en memoria y se decodifica
+        directamente desde el mapeo, sin copiar su contenido a un objeto bytes. Si no,
+        se lee completo en modo binario con una sola lectura y se decodifica con `json`.
+        En ningún caso se pasa por una capa de texto. Como no toca el estado del árbol,
+        puede llamarse desde otro hilo.
+
         :param archivo_json: Ruta del archivo JSON.
+        :return: Lista de diccionarios de productos.
+        """
+        with open(archivo_json, 'rb') as file:
+            # Un archivo vacío no se puede mapear; se deja que el decodificador lo rechace
+            if orjson is not None and os.fstat(file.fileno()).st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapeo:
+                    with memoryview(mapeo) as contenido:
+                        return orjson.loads(contenido)
+            contenido = file.read()
+        return orjson.loads(contenido) if orjson is not None else json.loads(contenido)
+
+
+    def cargar_datos(self, datos, archivo_json=None):
+        """
+        Agrega al árbol los productos leídos con `leer_json`.
+
+        Los productos se agregan con `bulk_insertar` y luego se aplican los cambios
+        pendientes del journal del archivo, si existe. El archivo JSON asociado se
+        actualiza una sola vez al final.
+
+        :param datos: Lista de diccionarios de productos.
+        :param archivo_json: Ruta del archivo del que salieron los datos (opcional), para
+            aplicar su journal.
+        :raises ValueError: Si alguna clave está repetida en los datos o ya existe en el árbol.
+        """
+        with self.bulk_update():
+            self.bulk_insertar(datos)
+            if archivo_json:
+                self._aplicar_journal(archivo_json)
+
+
+    def bulk_insertar(self, productos):
+        """
+        Inserta muchos productos a la vez.
+
+        En lugar de insertar producto por producto (con sus rotaciones y una escritura
+        del JSON por cada uno), ordena los productos por clave junto con los que ya
+        están en el árbol y reconstruye un árbol perfectamente balanceado en O(n), sin
+        rotaciones. El archivo JSON asociado se actualiza una sola vez.
+
+        :param productos: Iterable de diccionarios con las llaves clave, nombre,
+            cantidad, precio y categoria (el mismo formato del archivo JSON).
+        :raises ValueError: Si alguna clave está repetida o ya existe en el árbol. Ante
+            este o cualquier otro error al armar el árbol nuevo, el árbol no se modifica.
         """
-        with open(archivo_json, 'r') as file:
-            datos = json.load(file)
-        for producto in datos:
-            self.insertar(
+        productos = list(self.in_order_traversal()) + [
+            Producto(
                 producto['clave'],
                 producto['nombre'],
                 producto['cantidad'],
                 producto['precio'],
                 producto['categoria']
             )
+            for producto in productos
+        ]
+        productos.sort(key=attrgetter('clave'))
+
+        for anterior, siguiente in zip(productos, productos[1:]):
+            if anterior.clave == siguiente.clave:
+                raise ValueError(f"La clave {siguiente.clave} ya existe en el árbol.")
+
+        # El árbol nuevo y sus índices se arman aparte: si algo falla a mitad de camino,
+        # el árbol y los índices actuales quedan intactos
+        por_clave = {}
+        raiz = self._construir_balanceado(productos, 0, len(productos) - 1, por_clave)
+        por_categoria = {}
+        for producto in productos:
+            por_categoria.setdefault(_internar(producto.categoria), []).append(producto.clave)
+        por_precio = sorted((producto.precio, producto.clave) for producto in productos)
+        sin_stock = [producto.clave for producto in productos if producto.cantidad == 0]
+
+        self._search_cache.clear()
+        self._inorder_cache = None
+        self.raiz = raiz
+        self._by_key = por_clave
+        self._category_index = por_categoria
+        self._price_index = por_precio
+        self._out_of_stock_index = sin_stock
+        self._actualizar_json()
+
+
+    def _ruta_journal(self, archivo_json):
+        """
+        Retorna la ruta del journal asociado a un archivo JSON.
+
+        :param archivo_json: Ruta del archivo JSON.
+        :return: Ruta del journal.
+        """
+        return archivo_json + '.journal'
+
+
+    def _aplicar_journal(self, archivo_json):
+        """
+        Vuelve a aplicar los cambios registrados en el journal de un archivo JSON.
+
+        Las inserciones reemplazan el producto si la clave ya existe, de modo que
+        aplicar el journal sobre una instantánea que ya lo incluye da el mismo
+        resultado. Una última línea incompleta (escritura interrumpida) se ignora.
+
+        :param archivo_json: Ruta del archivo JSON cuyo journal se aplica.
+        """
+        ruta = self._ruta_journal(archivo_json)
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, 'r', encoding='utf-8') as file:
+            for linea in file:
+                try:
+                    cambio = json.loads(linea)
+                except ValueError:
+                    break
+                if cambio["op"] == "insertar":
+                    producto = cambio["producto"]
+                    if self.contiene(producto["clave"]):
+                        self.eliminar(producto["clave"])
+                    self.insertar(producto["clave"], producto["nombre"], producto["cantidad"],
+                                  producto["precio"], producto["categoria"])
+                elif cambio["op"] == "eliminar":
+                    self.eliminar(cambio["clave"])
+                elif cambio["op"] == "actualizar":
+                    self.actualizar_producto(cambio["clave"], cambio["cantidad"], cambio["precio"])
+
+
+    def _construir_balanceado(self, productos, inicio, fin, por_clave):
+        """
+        Construye un subárbol balanceado a partir de productos ordenados por clave.
+
+        Toma el elemento central como raíz y construye los subárboles con cada mitad,
+        por lo que la altura resultante es mínima y no se requieren rotaciones.
+
+        :param productos: Lista de productos ordenada por clave.
+        :param inicio: Índice inicial (inclusive) del rango a construir.
+        :param fin: Índice final (inclusive) del rango a construir.
+        :param por_clave: Diccionario clave -> nodo que se completa con los nodos creados.
+        :return: Raíz del subárbol construido, o None si el rango está vacío.
+        """
+        if inicio > fin:
+            return None
+
+        medio = (inicio + fin) // 2
+        producto = productos[medio]
+        nodo = NodoAVL(*producto)
+        por_clave[nodo.clave] = nodo
+        nodo.izquierda = self._construir_balanceado(productos, inicio, medio - 1, por_clave)
+        nodo.derecha = self._construir_balanceado(productos, medio + 1, fin, por_clave)
+
+        hl = nodo.izquierda.altura if nodo.izquierda else 0
+        hr = nodo.derecha.altura if nodo.derecha else 0
+        nodo.altura = hl + 1 if hl >= hr else hr + 1
+        nodo.balance = hl - hr
+        return nodo
+
+
+    def compactar_journal(self):
+        """
+        Escribe la instantánea completa si hay cambios que todavía no están en ella.
+
+        Los cambios sueltos se guardan en el journal y la instantánea se reescribe solo
+        cada `JOURNAL_COMPACT_EVERY` cambios; esta función se llama al terminar una
+        sesión (por ejemplo al cerrar la ventana) para que el archivo JSON quede al día.
+        """
+        if self.json_file and (self._journal_ops or self._dirty):
+            self.guardar_en_json()
 
 
     def guardar_en_json(self, archivo_json=None):
         """
         Guarda los datos del árbol AVL en un archivo JSON.
 
+        El contenido se escribe primero en un archivo temporal del mismo directorio y
+        luego reemplaza al destino, de modo que nunca queda un JSON a medio escribir.
+        Si `orjson` está instalado se usa para codificar; si no, el módulo `json`.
+        En ambos casos el archivo queda en UTF-8 con sangría de 2 espacios.
+
         :param archivo_json: Ruta del archivo JSON (opcional).
         """
         if archivo_json:
             self.json_file = archivo_json
         if not self.json_file:
             raise ValueError("No se ha especificado un archivo JSON")
-        datos = self.in_order_traversal()
-        with open(self.json_file, 'w') as file:
-            json.dump(datos, file, indent=2)
+        datos = [producto._asdict() for producto in self.in_order_traversal()]
+        directorio = os.path.dirname(os.path.abspath(self.json_file))
+        fd, temporal = tempfile.mkstemp(dir=directorio, suffix='.tmp')
+        try:
+            if orjson is not None:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(orjson.dumps(datos, option=orjson.OPT_INDENT_2))
+            else:
+                with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                    json.dump(datos, file, indent=2)
+            if os.path.exists(self.json_file):
+                shutil.copymode(self.json_file, temporal)
+            os.replace(temporal, self.json_file)
+        except BaseException:
+            os.remove(temporal)
+            raise
+        # La instantánea ya contiene todos los cambios: el journal sobra
+        journal = self._ruta_journal(self.json_file)
+        if os.path.exists(journal):
+            os.remove(journal)
+        self._journal_ops = 0
+        self._dirty = False
+
+
+    def _actualizar_json(self, cambio=None):
+        """
+        Registra en disco un cambio del árbol AVL.
 
+        El cambio se agrega como una línea JSON al journal. Se escribe en cambio la
+        instantánea completa si no se indica un cambio, si aún no existe la instantánea
+        inicial del archivo actual o si el journal ya alcanzó `JOURNAL_COMPACT_EVERY`
+        líneas. Dentro de un bloque `bulk_update` solo marca los datos como pendientes.
 
-    def _actualizar_json(self):
+        :param cambio: Diccionario que describe la operación (opcional).
         """
-        Actualiza el archivo JSON con los datos actuales del árbol AVL.
-        """
-        if self.json_file:
+        if not self.json_file:
+            return
+        if self._bulk_depth:
+            self._dirty = True
+            return
+        if (cambio is None or self._journal_ops is None
+                or self._journal_ops >= self.JOURNAL_COMPACT_EVERY):
             self.guardar_en_json()
+            return
+        with open(self._ruta_journal(self.json_file), 'a', encoding='utf-8') as file:
+            file.write(json.dumps(cambio, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._journal_ops += 1
+
+
+    @contextmanager
+    def bulk_update(self):
+        """
+        Agrupa varias modificaciones del árbol en una sola escritura del JSON.
+
+        Uso::
+
+            with arbol.bulk_update():
+                arbol.insertar(...)
+                arbol.eliminar(...)
+
+        Los bloques pueden anidarse; el archivo se escribe al salir del más externo
+        si hubo cambios. Si el bloque termina con una excepción no se escribe nada:
+        la instantánea y el journal en disco quedan como estaban, en lugar de
+        reemplazarse por un estado aplicado a medias. Los cambios que el bloque ya
+        había aplicado en memoria no están en el journal, así que la siguiente
+        escritura será la instantánea completa. Mientras dura el bloque tampoco
+        se notifican rotaciones al callback: quien lo usa redibuja una sola vez al
+        terminar en lugar de animar cada paso intermedio (por ejemplo al aplicar el
+        journal en `cargar_desde_json`).
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._dirty:
+                # Agregar al journal dejaría fuera lo aplicado dentro del bloque
+                self._journal_ops = None
+            raise
+        finally:
+            self._bulk_depth -= 1
+        # Solo se llega aquí si el bloque terminó sin excepciones
+        if not self._bulk_depth and self._dirty:
+            self._actualizar_json()
             
             
     def buscar_por_rango_precios(self, precio_min, precio_max):
         """
         Busca productos en el árbol AVL cuyo precio esté dentro de un rango dado.
 
+        El árbol está ordenado por clave y no por precio, así que su forma no sirve
+        para descartar subárboles por precio. En su lugar se usa el índice secundario
+        `_price_index`, una lista de tuplas (precio, clave) ordenada: con dos búsquedas
+        binarias se obtiene el tramo del rango en O(log n + k).
+
         :param precio_min: Precio mínimo.
         :param precio_max: Precio máximo.
-        :return: Lista de productos encontrados y el camino recorrido.
+        :return: Lista de productos encontrados (ordenada por precio y luego por clave)
+            y el camino recorrido, que en este caso son las claves encontradas.
         """
+        inicio = bisect.bisect_left(self._price_index, (precio_min, float('-inf')))
+        fin = bisect.bisect_right(self._price_index, (precio_max, float('inf')))
+
         resultados = []
         camino_busqueda = []
-        self._buscar_por_rango_precios(self.raiz, precio_min, precio_max, resultados, camino_busqueda)
+        for _, clave in self._price_index[inicio:fin]:
+            nodo = self._by_key[clave]
+            camino_busqueda.append(clave)
+            resultados.append(nodo.como_producto())
         return resultados, camino_busqueda
 
 
-    def _buscar_por_rango_precios(self, nodo, precio_min, precio_max, resultados, camino_busqueda):
-        """
-        Función recursiva para buscar productos por rango de precios en el árbol AVL.
-
-        :param nodo: Nodo actual en el recorrido del árbol.
-        :param precio_min: Precio mínimo.
-        :param precio_max: Precio máximo.
-        :param resultados: Lista que almacena los productos encontrados.
-        :param camino_busqueda: Lista que almacena el camino recorrido.
-        """
-        if not nodo:
-            return
-        
-        camino_busqueda.append(nodo.clave)
-        
-        if precio_min <= nodo.precio <= precio_max:
-            resultados.append({
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            })
-        
-        if precio_min < nodo.precio:
-            self._buscar_por_rango_precios(nodo.izquierda, precio_min, precio_max, resultados, camino_busqueda)
-        
-        if precio_max > nodo.precio:
-            self._buscar_por_rango_precios(nodo.derecha, precio_min, precio_max, resultados, camino_busqueda)
-            
-            
     def buscar_por_categoria(self, categoria):
         """
         Busca productos en el árbol AVL por categoría.
 
+        La categoría no es la clave del árbol, así que en lugar de recorrerlo completo
+        se consulta el índice secundario `_category_index`, que guarda las claves de
+        cada categoría ordenadas. El costo es proporcional a la cantidad de productos
+        encontrados y no al tamaño del árbol.
+
         :param categoria: Categoría del producto.
-        :return: Lista de productos encontrados y el camino recorrido.
+        :return: Lista de productos encontrados (ordenada por clave) y el camino
+            recorrido, que en este caso son las claves de los nodos encontrados.
         """
         if categoria not in ["Hogar", "Cocina", "Electrodomesticos", "Deportes"]:
             raise ValueError("Categoría no válida. Debe ser: Hogar, Cocina, Electrodomesticos o Deportes")
         
         resultados = []
-        camino_busqueda = []
-        self._buscar_por_categoria_recursivo(self.raiz, categoria, resultados, camino_busqueda)
-        return sorted(resultados, key=lambda x: x['clave']), camino_busqueda
-
-
-    def _buscar_por_categoria_recursivo(self, nodo, categoria, resultados, camino_busqueda):
-        """
-        Función recursiva para buscar productos por categoría en el árbol AVL.
-
-        :param nodo: Nodo actual en el recorrido del árbol.
-        :param categoria: Categoría del producto.
-        :param resultados: Lista que almacena los productos encontrados.
-        :param camino_busqueda: Lista que almacena el camino recorrido.
-        """
-        if not nodo:
-            return
-        
-        camino_busqueda.append(nodo.clave)
-        
-        self._buscar_por_categoria_recursivo(nodo.izquierda, categoria, resultados, camino_busqueda)
-        
-        if nodo.categoria == categoria:
-            resultados.append({
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            })
-        
-        self._buscar_por_categoria_recursivo(nodo.derecha, categoria, resultados, camino_busqueda)
+        camino_busqueda = list(self._category_index.get(categoria, ()))
+        for clave in camino_busqueda:
+            nodo = self._obtener_nodo(clave)
+            resultados.append(nodo.como_producto())
+        return resultados, camino_busqueda
         
         
         
@@ -593,91 +1119,69 @@ class AVLTree:
         """
         Realiza una búsqueda combinada por precio y categoría en el árbol AVL.
 
+        Ni el precio ni la categoría son la clave del árbol, así que su forma no sirve
+        para descartar subárboles. Los candidatos salen del índice secundario más
+        selectivo disponible: el de categorías si se indicó una, si no el de precios
+        si se indicó algún límite, y si no se indicó nada, todo el inventario.
+
         :param precio_min: Precio mínimo (opcional).
         :param precio_max: Precio máximo (opcional).
         :param categoria: Categoría del producto (opcional).
-        :return: Lista de productos encontrados y el camino recorrido.
+        :return: Lista de productos encontrados (ordenada por clave) y el camino
+            recorrido, que son las claves de los candidatos revisados.
         """
+        if categoria is not None:
+            camino_busqueda = list(self._category_index.get(categoria, ()))
+        elif precio_min is not None or precio_max is not None:
+            minimo = float('-inf') if precio_min is None else precio_min
+            maximo = float('inf') if precio_max is None else precio_max
+            inicio = bisect.bisect_left(self._price_index, (minimo, float('-inf')))
+            fin = bisect.bisect_right(self._price_index, (maximo, float('inf')))
+            camino_busqueda = sorted(clave for _, clave in self._price_index[inicio:fin])
+        else:
+            # Las claves salen del mismo recorrido, que ya está ordenado por clave
+            productos = list(self.in_order_traversal())
+            return productos, [producto.clave for producto in productos]
+
+        cumple_criterios = self._criterio_combinado(precio_min, precio_max, categoria)
         resultados = []
-        camino_busqueda = []
-        self._busqueda_combinada_recursiva(self.raiz, precio_min, precio_max, categoria, resultados, camino_busqueda)
-        return sorted(resultados, key=lambda x: x['clave']), camino_busqueda
+        for clave in camino_busqueda:
+            nodo = self._by_key[clave]
+            if cumple_criterios(nodo):
+                resultados.append(nodo.como_producto())
+        return resultados, camino_busqueda
 
 
-    def _busqueda_combinada_recursiva(self, nodo, precio_min, precio_max, categoria, resultados, camino_busqueda):
+    def _criterio_combinado(self, precio_min, precio_max, categoria):
         """
-        Función recursiva para realizar una búsqueda combinada por precio y categoría en el árbol AVL.
+        Construye el predicado que decide si un nodo cumple la búsqueda combinada.
+
+        Los criterios opcionales se resuelven una sola vez aquí, en lugar de revisar
+        en cada nodo cuáles fueron especificados. Los límites de precio ausentes se
+        reemplazan por -inf/+inf y la categoría (la comparación más selectiva) se
+        evalúa primero.
 
-        :param nodo: Nodo actual en el recorrido del árbol.
         :param precio_min: Precio mínimo (opcional).
         :param precio_max: Precio máximo (opcional).
         :param categoria: Categoría del producto (opcional).
-        :param resultados: Lista que almacena los productos encontrados.
-        :param camino_busqueda: Lista que almacena el camino recorrido.
+        :return: Función que recibe un nodo y retorna True si cumple los criterios.
         """
-        if not nodo:
-            return
-        
-        camino_busqueda.append(nodo.clave)
-        
-        
-        # Decidir si continuar la búsqueda en el subárbol izquierdo
-        if precio_min is None or nodo.precio >= precio_min:
-            self._busqueda_combinada_recursiva(nodo.izquierda, precio_min, precio_max, categoria, resultados, camino_busqueda)
-        
-        # Verificar si el nodo actual cumple con los criterios
-        cumple_criterios = True
-        if precio_min is not None and nodo.precio < precio_min:
-            cumple_criterios = False
-        if precio_max is not None and nodo.precio > precio_max:
-            cumple_criterios = False
-        if categoria is not None and nodo.categoria != categoria:
-            cumple_criterios = False
-        
-        if cumple_criterios:
-            resultados.append({
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            })
-        
-        # Decidir si continuar la búsqueda en el subárbol derecho
-        if precio_max is None or nodo.precio <= precio_max:
-            self._busqueda_combinada_recursiva(nodo.derecha, precio_min, precio_max, categoria, resultados, camino_busqueda)
+        minimo = float('-inf') if precio_min is None else precio_min
+        maximo = float('inf') if precio_max is None else precio_max
+        if categoria is None:
+            return lambda nodo: minimo <= nodo.precio <= maximo
+        categoria = _internar(categoria)
+        return lambda nodo: nodo.categoria == categoria and minimo <= nodo.precio <= maximo
             
             
     def verificar_stock(self):
         """
         Verifica los productos que están sin stock en el árbol AVL.
 
-        :return: Lista de productos sin stock.
-        """
-        productos_sin_stock = []
-        self._verificar_stock_recursivo(self.raiz, productos_sin_stock)
-        return productos_sin_stock
-
+        En lugar de recorrer todo el árbol se consulta el índice secundario
+        `_out_of_stock_index`, que guarda ordenadas las claves con cantidad 0, así que
+        el costo es proporcional a los productos agotados.
 
-    def _verificar_stock_recursivo(self, nodo, productos_sin_stock):
+        :return: Lista de productos sin stock (ordenada por clave).
         """
-        Función recursiva para verificar los productos sin stock en el árbol AVL.
-
-        :param nodo: Nodo actual en el recorrido del árbol.
-        :param productos_sin_stock: Lista que almacena los productos sin stock.
-        """
-        if not nodo:
-            return
-        
-        self._verificar_stock_recursivo(nodo.izquierda, productos_sin_stock)
-        
-        if nodo.cantidad == 0:
-            productos_sin_stock.append({
-                "clave": nodo.clave,
-                "nombre": nodo.nombre,
-                "cantidad": nodo.cantidad,
-                "precio": nodo.precio,
-                "categoria": nodo.categoria
-            })
-        
-        self._verificar_stock_recursivo(nodo.derecha, productos_sin_stock)
\ No newline at end of file
+        return [self._by_key[clave].como_producto() for clave in self._out_of_stock_index]
@@ -3,15 +3,31 @@
 import sys
 from PyQt5.QtWidgets import ( # type: ignore
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QLabel, QListWidget, QMessageBox, QGraphicsView,
-    QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsLineItem,
-    QFileDialog, QFormLayout, QGroupBox, QComboBox
+    QPushButton, QLineEdit, QLabel, QListWidget, QListView, QMessageBox, QGraphicsView,
+    QGraphicsScene, QGraphicsEllipseItem, QGraphicsSimpleTextItem, QGraphicsLineItem,
+    QFileDialog, QFormLayout, QGroupBox, QComboBox, QDialog, QDialogButtonBox
 )
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QIcon  #type: ignore
-from PyQt5.QtCore import Qt, QPointF, QTimer #type: ignore
+from PyQt5.QtGui import ( # type: ignore
+    QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QFontMetrics, QIcon, QRegularExpressionValidator
+)
+from PyQt5.QtCore import ( # type: ignore
+    Qt, QPointF, QRectF, QRegularExpression, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractListModel, QModelIndex
+)
+from PyQt5 import sip # type: ignore
 from models.avl import AVLTree
 from collections import deque
 
+# Formatos aceptados por los campos numéricos. Los validadores de Qt solo dejan escribir
+# texto que cumple (o empieza a cumplir) el patrón, así que todo texto no vacío de estos
+# campos se convierte con int()/float() sin fallar.
+INT_PATTERN = QRegularExpression(r"\d{1,9}")
+PRICE_PATTERN = QRegularExpression(r"\d{1,12}(\.\d{0,4})?")
+
+# A partir de esta cantidad de resultados una búsqueda se muestra en `ResultsDialog`
+# en lugar de armar todo el texto en un QMessageBox
+MAX_MESSAGE_RESULTS = 200
+
 class AVLVisualizer(QGraphicsView):
     """
     Clase que visualiza un árbol AVL utilizando PyQt5.
@@ -31,7 +47,7 @@ class AVLVisualizer(QGraphicsView):
         Espacio vertical entre niveles del árbol.
         
     horizontal_gap : int
-        Espacio horizontal entre nodos del mismo nivel.
+        Espacio horizontal entre dos nodos consecutivos en orden (in-order).
         
     search_path : list
         Lista que almacena el camino de búsqueda en el árbol.
@@ -39,6 +55,9 @@ class AVLVisualizer(QGraphicsView):
     search_index : int
         Índice actual en el camino de búsqueda.
         
+    search_keys : set
+        Claves del camino de búsqueda ya recorridas (hasta `search_index`).
+        
     search_timer : QTimer
         Temporizador para animar los pasos de búsqueda.
         
@@ -51,6 +70,16 @@ class AVLVisualizer(QGraphicsView):
     highlighted_nodes : set
         Conjunto de nodos resaltados.
         
+    node_items : dict
+        Clave -> (nodo, elipse, texto) de los nodos dibujados, para recolorearlos y
+        reubicarlos sin reconstruir la escena.
+        
+    edges_item : QGraphicsPathItem
+        Elemento único con todas las aristas del árbol.
+        
+    layout_positions : list
+        Tuplas (nodo, x, y) del último layout calculado por `draw_tree`.
+        
     timer : QTimer
         Temporizador para procesar eventos de rotación.
 
@@ -66,9 +95,16 @@ class AVLVisualizer(QGraphicsView):
         Resalta el siguiente paso en el camino de búsqueda.
         
     process_rotation_event(self)
-        Procesa el siguiente evento de rotación en la cola.
+        Procesa los eventos de rotación pendientes en la cola.
     """
 
+    # Lápiz, rellenos y fuente compartidos por todas las instancias; se crean en el
+    # primer __init__, cuando ya existe la QApplication
+    _PEN = None
+    _BRUSHES = {}
+    _FONT = None
+    _FONT_METRICS = None
+
     def __init__(self, avl_tree, parent=None):
         """
         Inicializa la visualización del árbol AVL.
@@ -81,29 +117,53 @@ class AVLVisualizer(QGraphicsView):
             Widget padre de la visualización.
         """
         super().__init__(parent)
+        cls = type(self)
+        if cls._PEN is None:
+            cls._PEN = QPen(Qt.black, 2)
+            cls._BRUSHES = {
+                'highlight': QBrush(QColor(250, 100, 100)),  # Rojo para resaltar
+                'search': QBrush(QColor(100, 250, 100)),  # Verde para el camino de búsqueda
+                'stock0': QBrush(QColor(200, 200, 200)),  # Gris para productos fuera de stock
+                'default': QBrush(QColor(100, 200, 250)),  # Azul claro por defecto
+            }
+            cls._FONT = QFont()
+            cls._FONT_METRICS = QFontMetrics(cls._FONT)
         self.avl_tree = avl_tree
-        self.scene = QGraphicsScene()
+        # La vista es dueña de la escena: se destruyen juntas
+        self.scene = QGraphicsScene(self)
+        # Qué nodos se ven se decide con `layout_positions`, no con la escena, y al desplazarse
+        # se agregan y retiran elementos constantemente: no conviene mantener su índice BSP
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self.setRenderHint(QPainter.Antialiasing)
         self.node_radius = 15
         self.level_gap = 40
-        self.horizontal_gap = 240
+        self.horizontal_gap = self.node_radius * 2 + 6
         self.setMinimumHeight(300)
         self.setMinimumWidth(500)
         
         self.search_path = []
         self.search_index = 0
-        self.search_timer = QTimer()
+        self.search_keys = set()
+        self.search_timer = QTimer(self)
         self.search_timer.timeout.connect(self.highlight_next_search_step)
         
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Al desplazarse aparecen nodos que aún no se crearon
+        self.horizontalScrollBar().valueChanged.connect(self.draw_visible_nodes)
+        self.verticalScrollBar().valueChanged.connect(self.draw_visible_nodes)
 
         self.rotation_events = deque()
         self.is_animating = False
         self.highlighted_nodes = set()
+        self.node_items = {}
+        self.layout_positions = []
+        self.edges_item = self.scene.addPath(QPainterPath(), self._PEN)
+        self.edges_item.setZValue(-1)  # Las aristas quedan debajo de los nodos
 
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.process_rotation_event)
 
     def add_rotation_event(self, event):
@@ -118,23 +178,27 @@ class AVLVisualizer(QGraphicsView):
         self.rotation_events.append(event)
         if not self.is_animating:
             self.is_animating = True
-            self.timer.start(1000)  # 1000 ms entre eventos
+            if self.isVisible():  # Si está oculta, `showEvent` inicia la animación
+                self.timer.start(1000)  # 1000 ms entre eventos
             
 
     def process_rotation_event(self):
         """
-        Procesa el siguiente evento de rotación en la cola.
+        Procesa los eventos de rotación pendientes en la cola.
 
         Este método es llamado por el temporizador para animar las rotaciones
-        en el árbol AVL.
+        en el árbol AVL. Todas las rotaciones encoladas (por ejemplo las de una misma
+        operación) se resaltan juntas en un solo paso de la animación.
         """
         if self.rotation_events:
-            event = self.rotation_events.popleft()
-            tipo_rotacion, clave_y, clave_x = event
-            print(f"Realizando {tipo_rotacion} en nodos y: {clave_y}, x: {clave_x}")
-            
-            self.highlighted_nodes = {clave_y, clave_x}
-            self.draw_tree()
+            events = list(self.rotation_events)
+            self.rotation_events.clear()
+            for tipo_rotacion, clave_y, clave_x in events:
+                print(f"Realizando {tipo_rotacion} en nodos y: {clave_y}, x: {clave_x}")
+
+            self.highlighted_nodes = {clave for _, clave_y, clave_x in events
+                                      for clave in (clave_y, clave_x)}
+            self.refresh_highlight()
 
             QTimer.singleShot(800, self.clear_highlight)  # 800 ms de resaltado
         else:
@@ -150,23 +214,179 @@ class AVLVisualizer(QGraphicsView):
         durante una animación de rotación.
         """
         self.highlighted_nodes = set()
-        self.draw_tree()
+        self.refresh_highlight()
 
 
     def draw_tree(self):
         """
         Dibuja el árbol AVL en la escena gráfica.
 
-        Este método limpia la escena actual y dibuja el árbol AVL desde la raíz.
+        El árbol se recorre desde la raíz en dos pasadas: primero se calcula la posición
+        de cada nodo y se arma un único trazado con todas las aristas, y luego se asigna
+        al elemento de aristas de la escena. La escena no se limpia: los nodos ya dibujados
+        que siguen en el árbol se mueven a su nueva posición y se recolorean, y solo se
+        retiran los que ya no existen. Los nodos que faltan se crean únicamente si caen
+        dentro del área visible (ver `draw_visible_nodes`).
         """
-        self.scene.clear()
+        posiciones, aristas = [], QPainterPath()
         if self.avl_tree.raiz:
-            self._draw_node(self.avl_tree.raiz, 0, self.width() / 2, 0)
-        self.scene.setSceneRect(self.scene.itemsBoundingRect())
+            posiciones, aristas = self._layout_tree(self.avl_tree.raiz, self.width() / 2)
+        self.edges_item.setPath(aristas)
+        self.layout_positions = posiciones
+
+        # Reubicar los elementos de los nodos que siguen en el árbol
+        r = self.node_radius
+        metrics = self._FONT_METRICS
+        text_height = metrics.height()
+        anteriores = self.node_items
+        self.node_items = {}
+        for node, x, y in posiciones:
+            item = anteriores.pop(node.clave, None)
+            if item is not None:
+                _, ellipse, text = item
+                ellipse.setRect(x - r, y - r, r * 2, r * 2)
+                ellipse.setBrush(self._node_brush(node, self.search_keys))
+                text.setPos(x - metrics.horizontalAdvance(text.text()) / 2, y - text_height / 2)
+                self.node_items[node.clave] = (node, ellipse, text)
+        for _, ellipse, text in anteriores.values():
+            self.scene.removeItem(ellipse)
+            self.scene.removeItem(text)
+
+        if posiciones:
+            # El área de la escena sale del layout, no de los elementos creados
+            r = self.node_radius + 2
+            xs = [x for _, x, _ in posiciones]
+            ys = [y for _, _, y in posiciones]
+            self.scene.setSceneRect(QRectF(min(xs) - r, min(ys) - r,
+                                           max(xs) - min(xs) + 2 * r, max(ys) - min(ys) + 2 * r))
+            self.draw_visible_nodes()
+        else:
+            self.scene.setSceneRect(QRectF())
 
 
+    def draw_visible_nodes(self):
+        """
+        Agrega a la escena los nodos del último layout que quedan dentro del viewport.
 
-    def _draw_node(self, node, depth, x, parent_x):
+        Los nodos que salen del área visible se retiran de la escena y los que entran se
+        crean; los que siguen visibles no se tocan. Se llama después de `draw_tree` y
+        cada vez que la vista se desplaza o cambia de tamaño.
+        """
+        # Al cerrar la ventana las barras de desplazamiento todavía pueden emitir señales
+        # cuando la escena ya fue destruida
+        if not self.layout_positions or sip.isdeleted(self.scene):
+            return
+        r = self.node_radius
+        visible = self.mapToScene(self.viewport().rect()).boundingRect().adjusted(-r, -r, r, r)
+
+        search_keys = self.search_keys
+        drawn = self.node_items
+        for node, x, y in self.layout_positions:
+            if visible.contains(x, y):
+                if node.clave not in drawn:
+                    self._draw_node(node, x, y, self._PEN, search_keys)
+            elif node.clave in drawn:
+                _, ellipse, text = drawn.pop(node.clave)
+                self.scene.removeItem(ellipse)
+                self.scene.removeItem(text)
+
+
+    def hideEvent(self, event):
+        """
+        Detiene la animación de rotaciones mientras la vista no se muestra.
+
+        Los eventos pendientes quedan en la cola y se animan al volver a mostrarse.
+
+        Parámetros:
+        -----------
+        event : QHideEvent
+            Evento de ocultamiento.
+        """
+        super().hideEvent(event)
+        self.timer.stop()
+
+
+    def showEvent(self, event):
+        """
+        Reanuda la animación de rotaciones si quedaron eventos en la cola.
+
+        Parámetros:
+        -----------
+        event : QShowEvent
+            Evento de visualización.
+        """
+        super().showEvent(event)
+        if self.is_animating and not self.timer.isActive():
+            self.timer.start(1000)
+
+
+    def resizeEvent(self, event):
+        """
+        Completa los nodos visibles cuando cambia el tamaño de la vista.
+
+        Parámetros:
+        -----------
+        event : QResizeEvent
+            Evento de cambio de tamaño.
+        """
+        super().resizeEvent(event)
+        self.draw_visible_nodes()
+
+
+    def _layout_tree(self, root, root_x):
+        """
+        Calcula las posiciones de los nodos recorriendo el árbol por niveles.
+
+        La coordenada x de cada nodo sale de su posición in-order, así cada nodo queda
+        a la derecha de todo su subárbol izquierdo y a la izquierda del derecho, y
+        ningún par de nodos se encima sin importar la profundidad. Un primer recorrido
+        in-order (iterativo) asigna esas posiciones.
+
+        Parámetros:
+        -----------
+        root : NodoAVL
+            Raíz del árbol AVL.
+        root_x : float
+            Coordenada x de la raíz.
+
+        Retorna:
+        --------
+        tuple
+            Lista de tuplas (nodo, x, y) y un QPainterPath con todas las aristas.
+        """
+        # Primera pasada: posición in-order de cada nodo
+        orden = {}
+        pila = []
+        node = root
+        while pila or node:
+            while node:
+                pila.append(node)
+                node = node.izquierda
+            node = pila.pop()
+            orden[node.clave] = len(orden)
+            node = node.derecha
+        origen = root_x - orden[root.clave] * self.horizontal_gap
+
+        # Segunda pasada: coordenadas por niveles y aristas
+        posiciones = []
+        aristas = QPainterPath()
+        cola = deque([(root, 0)])
+        while cola:
+            node, depth = cola.popleft()
+            x = origen + orden[node.clave] * self.horizontal_gap
+            y = depth * self.level_gap + self.node_radius * 2
+            posiciones.append((node, x, y))
+
+            child_y = y + self.level_gap
+            for child in (node.izquierda, node.derecha):
+                if child:
+                    aristas.moveTo(x, y)
+                    aristas.lineTo(origen + orden[child.clave] * self.horizontal_gap, child_y)
+                    cola.append((child, depth + 1))
+        return posiciones, aristas
+
+
+    def _draw_node(self, node, x, y, pen, search_keys):
         """
         Dibuja un nodo específico del árbol AVL.
 
@@ -174,45 +394,81 @@ class AVLVisualizer(QGraphicsView):
         -----------
         node : AVLNode
             Nodo del árbol AVL que se va a dibujar.
-        depth : int
-            Profundidad del nodo en el árbol.
         x : float
             Coordenada x donde se dibujará el nodo.
-        parent_x : float
-            Coordenada x del nodo padre.
+        y : float
+            Coordenada y donde se dibujará el nodo.
+        pen : QPen
+            Lápiz para el borde del nodo.
+        search_keys : set
+            Claves del camino de búsqueda ya recorridas.
         """
-        y = depth * self.level_gap + self.node_radius * 2
+        ellipse = self.scene.addEllipse(x - self.node_radius, y - self.node_radius,
+                                        self.node_radius * 2, self.node_radius * 2,
+                                        pen, self._node_brush(node, search_keys))
+
+        # Una etiqueta simple basta para la clave: no necesita un QTextDocument
+        label = str(node.clave)
+        text = QGraphicsSimpleTextItem(label)
+        text.setFont(self._FONT)
+        self.scene.addItem(text)
+        text_width = self._FONT_METRICS.horizontalAdvance(label)
+        text_height = self._FONT_METRICS.height()
+        text.setPos(x - text_width / 2, y - text_height / 2)
+        self.node_items[node.clave] = (node, ellipse, text)
 
-        if node.izquierda:
-            child_x = x - self.horizontal_gap / (depth + 1)
-            child_y = y + self.level_gap
-            line = self.scene.addLine(x, y, child_x, child_y, QPen(Qt.black, 2))
-            self._draw_node(node.izquierda, depth + 1, child_x, x)
-        if node.derecha:
-            child_x = x + self.horizontal_gap / (depth + 1)
-            child_y = y + self.level_gap
-            line = self.scene.addLine(x, y, child_x, child_y, QPen(Qt.black, 2))
-            self._draw_node(node.derecha, depth + 1, child_x, x)
 
-        # Determinar el color del nodo
+    def _node_brush(self, node, search_keys):
+        """
+        Determina el relleno de un nodo entre los pinceles compartidos de la clase.
+
+        Parámetros:
+        -----------
+        node : NodoAVL
+            Nodo del árbol AVL.
+        search_keys : set
+            Claves del camino de búsqueda ya recorridas.
+
+        Retorna:
+        --------
+        QBrush
+            Relleno del nodo.
+        """
         if node.clave in self.highlighted_nodes:
-            ellipse_color = QColor(250, 100, 100)  # Rojo para resaltar
-        elif node.clave in self.search_path[:self.search_index + 1]:
-            ellipse_color = QColor(100, 250, 100)  # Verde para el camino de búsqueda
+            return self._BRUSHES['highlight']
+        elif node.clave in search_keys:
+            return self._BRUSHES['search']
         elif node.cantidad == 0:
-            ellipse_color = QColor(200, 200, 200)  # Gris para productos fuera de stock
-        else:
-            ellipse_color = QColor(100, 200, 250)  # Azul claro por defecto
+            return self._BRUSHES['stock0']
+        return self._BRUSHES['default']
 
-        ellipse = self.scene.addEllipse(x - self.node_radius, y - self.node_radius,
-                                        self.node_radius * 2, self.node_radius * 2,
-                                        QPen(Qt.black, 2), QBrush(ellipse_color))
 
-        text = self.scene.addText(str(node.clave))
-        text.setDefaultTextColor(Qt.black)
-        text_width = text.boundingRect().width()
-        text_height = text.boundingRect().height()
-        text.setPos(x - text_width / 2, y - text_height / 2)
+    def refresh_highlight(self):
+        """
+        Recolorea los nodos ya dibujados según el resaltado actual.
+
+        Las animaciones de búsqueda y de rotación solo cambian colores: en lugar de
+        limpiar y redibujar la escena completa, se cambia el relleno de las elipses
+        existentes. La estructura se vuelve a dibujar con `draw_tree`.
+        """
+        search_keys = self.search_keys
+        for node, ellipse, _ in self.node_items.values():
+            ellipse.setBrush(self._node_brush(node, search_keys))
+
+
+    def refresh_node(self, clave):
+        """
+        Recolorea un solo nodo, si está dibujado, según el resaltado actual.
+
+        Parámetros:
+        -----------
+        clave : int
+            Clave del nodo a recolorear.
+        """
+        item = self.node_items.get(clave)
+        if item is not None:
+            node, ellipse, _ = item
+            ellipse.setBrush(self._node_brush(node, self.search_keys))
 
 
     def update_tree(self):
@@ -235,6 +491,10 @@ class AVLVisualizer(QGraphicsView):
         """
         self.search_path = path
         self.search_index = -1
+        # Los pasos solo recolorean el nodo agregado: el camino anterior se despinta aquí
+        anteriores, self.search_keys = self.search_keys, set()
+        for clave in anteriores:
+            self.refresh_node(clave)
         self.search_timer.start(500)  
         
         
@@ -246,10 +506,15 @@ class AVLVisualizer(QGraphicsView):
         búsqueda en el árbol AVL.
         """
         self.search_index += 1
-        if self.search_index >= len(self.search_path):
+        if self.search_index < len(self.search_path):
+            # El conjunto crece con cada paso en lugar de rearmarse desde el camino, y
+            # solo cambia de color el nodo que se agrega
+            clave = self.search_path[self.search_index]
+            self.search_keys.add(clave)
+            self.refresh_node(clave)
+        else:
             self.search_timer.stop()
             QTimer.singleShot(2000, self.clear_search_path)  # Limpiar después de 2 segundos
-        self.draw_tree()
 
 
     def clear_search_path(self):
@@ -261,9 +526,187 @@ class AVLVisualizer(QGraphicsView):
         """
         self.search_path = []
         self.search_index = -1
-        self.draw_tree()
+        self.search_keys = set()
+        self.refresh_highlight()
         
         
+class InventoryModel(QAbstractListModel):
+    """
+    Modelo de lista con los productos del inventario, para mostrarlos en un QListView.
+
+    Guarda solo la lista de `Producto` del último recorrido y arma el texto de una fila
+    cuando la vista lo pide, es decir, solo para las filas visibles. No se crea ningún
+    objeto por fila como ocurría con QListWidgetItem.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Inicializa un modelo vacío.
+
+        Parámetros:
+        -----------
+        parent : QObject, opcional
+            Objeto padre del modelo.
+        """
+        super().__init__(parent)
+        self.products = ()
+
+    def set_products(self, products):
+        """
+        Reemplaza los productos mostrados.
+
+        Compara la lista nueva con la actual: si solo cambiaron algunos productos se
+        notifican esas filas, y si se agregó o quitó un único producto (el caso de
+        insertar y eliminar) se inserta o retira solo esa fila. Cualquier otro cambio,
+        como cargar un JSON, reinicia el modelo completo.
+
+        Parámetros:
+        -----------
+        products : list
+            Secuencia (lista o tupla) de `Producto` en el orden en que se muestran.
+        """
+        anteriores = self.products
+        if products is anteriores:
+            # `in_order_traversal` devuelve la misma lista si el árbol no cambió
+            return
+        delta = len(products) - len(anteriores)
+        if delta == 0:
+            cambiadas = [i for i, (a, b) in enumerate(zip(anteriores, products)) if a != b]
+            self.products = products
+            if cambiadas:
+                self.dataChanged.emit(self.index(cambiadas[0]), self.index(cambiadas[-1]),
+                                      [Qt.DisplayRole])
+            return
+        if abs(delta) == 1:
+            corta, larga = (anteriores, products) if delta == 1 else (products, anteriores)
+            fila = next((i for i, (a, b) in enumerate(zip(corta, larga)) if a != b), len(corta))
+            if corta[fila:] == larga[fila + 1:] and corta[:fila] == larga[:fila]:
+                if delta == 1:
+                    self.beginInsertRows(QModelIndex(), fila, fila)
+                    self.products = products
+                    self.endInsertRows()
+                else:
+                    self.beginRemoveRows(QModelIndex(), fila, fila)
+                    self.products = products
+                    self.endRemoveRows()
+                return
+        self.beginResetModel()
+        self.products = products
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Retorna la cantidad de filas (productos) del modelo.
+        """
+        if parent.isValid():
+            return 0
+        return len(self.products)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Retorna el texto de la fila pedida por la vista.
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        producto = self.products[index.row()]
+        return (f"Clave: {producto.clave}, Nombre: {producto.nombre}, "
+                f"Cantidad: {producto.cantidad}, Precio: {producto.precio}, "
+                f"Categoría: {producto.categoria}")
+
+
+class ResultsDialog(QDialog):
+    """
+    Diálogo con los resultados de una búsqueda, para listas de productos muy largas.
+
+    Muestra los productos en un QListView sobre un `InventoryModel`, así solo se arma
+    el texto de las filas visibles y el diálogo abre igual de rápido sin importar la
+    cantidad de resultados.
+    """
+
+    def __init__(self, title, header, products, parent=None):
+        """
+        Inicializa el diálogo.
+
+        Parámetros:
+        -----------
+        title : str
+            Título de la ventana.
+        header : str
+            Texto que se muestra sobre la lista.
+        products : list
+            Lista de `Producto` encontrados.
+        parent : QWidget, opcional
+            Widget padre del diálogo.
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(600, 400)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"{header} ({len(products)})"))
+
+        self.model = InventoryModel(self)
+        self.model.set_products(products)
+        view = QListView()
+        view.setUniformItemSizes(True)
+        view.setModel(self.model)
+        layout.addWidget(view)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok)
+        buttons.accepted.connect(self.accept)
+        layout.addWidget(buttons)
+
+
+class JsonLoadSignals(QObject):
+    """
+    Señales con las que `JsonLoadWorker` informa el resultado de la lectura.
+
+    Atributos:
+    ----------
+    finished : pyqtSignal(str, object)
+        Ruta del archivo y lista de productos leídos.
+    failed : pyqtSignal(str, str)
+        Ruta del archivo y mensaje del error ocurrido.
+    """
+    finished = pyqtSignal(str, object)
+    failed = pyqtSignal(str, str)
+
+
+class JsonLoadWorker(QRunnable):
+    """
+    Tarea que lee y decodifica un archivo JSON en un hilo del `QThreadPool`.
+
+    Solo llama a `AVLTree.leer_json`, que no modifica el árbol; los productos se
+    agregan después en el hilo de la interfaz, al recibir la señal `finished`.
+    """
+
+    def __init__(self, avl_tree, file_name):
+        """
+        Inicializa la tarea de lectura.
+
+        Parámetros:
+        -----------
+        avl_tree : AVLTree
+            Árbol que sabe leer el formato del archivo.
+        file_name : str
+            Ruta del archivo JSON a leer.
+        """
+        super().__init__()
+        self.avl_tree = avl_tree
+        self.file_name = file_name
+        self.signals = JsonLoadSignals()
+
+    def run(self):
+        """
+        Lee el archivo y emite `finished` con los datos o `failed` con el error.
+        """
+        try:
+            datos = self.avl_tree.leer_json(self.file_name)
+        except Exception as e:
+            self.signals.failed.emit(self.file_name, str(e))
+        else:
+            self.signals.finished.emit(self.file_name, datos)
+
+
 class MainWindow(QMainWindow):
     """
     Clase principal de la ventana que maneja la interfaz gráfica del programa de inventario de productos.
@@ -307,12 +750,45 @@ class MainWindow(QMainWindow):
         ComboBox para seleccionar la categoría en la búsqueda combinada.
     tree_view : AVLVisualizer
         Widget para visualizar el árbol AVL.
-    inventory_list : QListWidget
+    inventory_model : InventoryModel
+        Modelo con los productos del inventario en orden.
+    inventory_list : QListView
         Lista para mostrar el inventario en orden.
     rotation_list : QListWidget
         Lista para mostrar el registro de rotaciones del árbol AVL.
     """
 
+    # Estilo de los campos de entrada, aplicado una vez en `init_ui`
+    _INPUT_STYLE = """
+        QLineEdit {
+            border: 2px solid #ccc;
+            border-radius: 4px;
+            padding: 5px;
+            background-color: #f8f8f8;
+            selection-background-color: #a6a6a6;
+        }
+        QLineEdit:focus {
+            border-color: #66afe9;
+        }
+    """
+
+    # Icono de la ventana, compartido por todas las instancias (ver `get_icon`)
+    _APP_ICON = None
+
+    @classmethod
+    def get_icon(cls):
+        """
+        Retorna el icono de la aplicación, cargándolo del disco solo la primera vez.
+
+        Retorna:
+        --------
+        QIcon
+            Icono de la ventana principal.
+        """
+        if cls._APP_ICON is None:
+            cls._APP_ICON = QIcon("archivos/inventario-icono-png.png")
+        return cls._APP_ICON
+
     def __init__(self):
         """
         Inicializa la ventana principal, configura el título, el icono y los widgets.
@@ -331,8 +807,10 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.setWindowTitle("Inventario de Productos")
-        self.setWindowIcon(QIcon("archivos\\inventario-icono-png.png"))
+        self.setWindowIcon(self.get_icon())
         self.avl = AVLTree()
+        self.pending_rotations = []  # Mensajes de rotación aún no agregados a la lista
+        self._ui_dirty = False  # Hay una actualización de la interfaz programada
         self.avl.set_rotation_callback(self.handle_rotation)
         self.init_ui()
 
@@ -362,19 +840,9 @@ class MainWindow(QMainWindow):
         # Área de control (insertar, eliminar, buscar)
         control_layout = QVBoxLayout()
 
-        # Estilo mejorado para los campos de entrada
-        input_style = """
-            QLineEdit {
-                border: 2px solid #ccc;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: #f8f8f8;
-                selection-background-color: #a6a6a6;
-            }
-            QLineEdit:focus {
-                border-color: #66afe9;
-            }
-        """
+        # Estilo mejorado para los campos de entrada: se aplica una sola vez al widget
+        # central y Qt lo hereda a todos los QLineEdit hijos
+        central_widget.setStyleSheet(self._INPUT_STYLE)
 
         # Formulario de inserción horizontal
         insert_group = QGroupBox("Insertar Nuevo Producto")
@@ -395,7 +863,6 @@ class MainWindow(QMainWindow):
         for input_field in [self.insert_key_input, self.insert_nombre_input, 
                             self.insert_cantidad_input, self.insert_precio_input, 
                             self.insert_categoria_input]:
-            input_field.setStyleSheet(input_style)
             insert_layout.addWidget(input_field)
 
         insert_button = QPushButton("Insertar")
@@ -418,7 +885,6 @@ class MainWindow(QMainWindow):
         self.update_precio_input.setPlaceholderText("Nuevo Precio")
 
         for input_field in [self.update_key_input, self.update_cantidad_input, self.update_precio_input]:
-            input_field.setStyleSheet(input_style)
             update_layout.addWidget(input_field)
 
         update_button = QPushButton("Actualizar")
@@ -435,7 +901,6 @@ class MainWindow(QMainWindow):
         delete_layout = QVBoxLayout()
         self.delete_key_input = QLineEdit()
         self.delete_key_input.setPlaceholderText("Clave")
-        self.delete_key_input.setStyleSheet(input_style)
         delete_button = QPushButton("Eliminar")
         delete_button.clicked.connect(self.delete_node)
         delete_layout.addWidget(QLabel("Eliminar:"))
@@ -447,7 +912,6 @@ class MainWindow(QMainWindow):
         search_layout = QVBoxLayout()
         self.search_key_input = QLineEdit()
         self.search_key_input.setPlaceholderText("Clave")
-        self.search_key_input.setStyleSheet(input_style)
         search_button = QPushButton("Buscar")
         search_button.clicked.connect(self.search_node)
         search_layout.addWidget(QLabel("Buscar:"))
@@ -514,6 +978,16 @@ class MainWindow(QMainWindow):
         combined_search_group.setLayout(combined_search_layout)
         main_layout.addWidget(combined_search_group)
 
+        # Validadores de los campos numéricos (ver INT_PATTERN y PRICE_PATTERN)
+        for input_field in [self.insert_key_input, self.insert_cantidad_input,
+                            self.update_key_input, self.update_cantidad_input,
+                            self.delete_key_input, self.search_key_input]:
+            input_field.setValidator(QRegularExpressionValidator(INT_PATTERN, input_field))
+        for input_field in [self.insert_precio_input, self.update_precio_input,
+                            self.min_price_input, self.max_price_input,
+                            self.combined_min_price_input, self.combined_max_price_input]:
+            input_field.setValidator(QRegularExpressionValidator(PRICE_PATTERN, input_field))
+
         # Layout para la visualización del árbol y los logs de rotación
         visualization_layout = QHBoxLayout()
 
@@ -526,7 +1000,10 @@ class MainWindow(QMainWindow):
 
         # Lista de inventario (in-order traversal)
         inventory_label = QLabel("Inventario (In-Order):")
-        self.inventory_list = QListWidget()
+        self.inventory_model = InventoryModel()
+        self.inventory_list = QListView()
+        self.inventory_list.setUniformItemSizes(True)
+        self.inventory_list.setModel(self.inventory_model)
         lists_layout.addWidget(inventory_label)
         lists_layout.addWidget(self.inventory_list)
 
@@ -558,25 +1035,22 @@ class MainWindow(QMainWindow):
         precio_text = self.insert_precio_input.text()
         categoria = self.insert_categoria_input.text()
 
-        if not all([key_text, nombre, cantidad_text, precio_text, categoria]):
+        if not (key_text and nombre and cantidad_text and precio_text and categoria):
             QMessageBox.warning(self, "Error", "Todos los campos son obligatorios.")
             return
 
+        # Los validadores de los campos garantizan el formato numérico
+        key = int(key_text)
+        cantidad = int(cantidad_text)
+        precio = float(precio_text)
+
+        # `insertar` ya verifica que la clave no exista: no se consulta el árbol dos veces
         try:
-            key = int(key_text)
-            cantidad = int(cantidad_text)
-            precio = float(precio_text)
+            self.avl.insertar(key, nombre, cantidad, precio, categoria)
         except ValueError:
-            QMessageBox.warning(self, "Error", "Clave y cantidad deben ser enteros, y precio debe ser un número.")
-            return
-
-        # Verificar si la clave ya existe
-        if self.avl.buscar(key)[0] is not None:
             QMessageBox.warning(self, "Error", "La clave ya existe en el inventario.")
             return
-
-        self.avl.insertar(key, nombre, cantidad, precio, categoria)
-        self.update_ui()
+        self.request_update()
         self.clear_insert_inputs()
         
         
@@ -610,13 +1084,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "La clave es obligatoria.")
             return
 
-        try:
-            key = int(key_text)
-            quantity = int(quantity_text) if quantity_text else None
-            price = float(price_text) if price_text else None
-        except ValueError:
-            QMessageBox.warning(self, "Error", "Clave y cantidad deben ser enteros, y precio debe ser un número.")
-            return
+        key = int(key_text)
+        quantity = int(quantity_text) if quantity_text else None
+        price = float(price_text) if price_text else None
 
         if quantity is None and price is None:
             QMessageBox.warning(self, "Error", "Debe ingresar al menos una nueva cantidad o un nuevo precio.")
@@ -625,7 +1095,7 @@ class MainWindow(QMainWindow):
         result = self.avl.actualizar_producto(key, quantity, price)
         if result:
             QMessageBox.information(self, "Éxito", "Producto actualizado correctamente.")
-            self.update_ui()
+            self.request_update()
         else:
             QMessageBox.warning(self, "Error", "No se encontró un producto con la clave especificada.")
 
@@ -674,23 +1144,20 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "La clave no puede estar vacía.")
             return
 
-        try:
-            key = int(key_text)
-        except ValueError:
-            QMessageBox.warning(self, "Error", "La clave debe ser un número entero.")
-            return
+        key = int(key_text)
 
-        if self.avl.buscar(key) is None:
+        if not self.avl.contiene(key):
             QMessageBox.information(self, "Información", f"La clave {key} no existe en el árbol.")
             return
 
         rotations = self.avl.eliminar(key)
-        self.update_ui()
+        self.request_update()
         self.delete_key_input.clear()
 
         # Crear mensaje detallado de las rotaciones
         if rotations:
-            rotation_message = "Se realizaron las siguientes rotaciones:\n" + "\n".join(rotations)
+            rotation_message = ("Se realizaron las siguientes rotaciones:\n"
+                                + "\n".join(self.avl.formatear_rotaciones(rotations)))
         else:
             rotation_message = "No se requirieron rotaciones para balancear el árbol."
 
@@ -723,19 +1190,15 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "La clave no puede estar vacía.")
             return
 
-        try:
-            key = int(key_text)
-        except ValueError:
-            QMessageBox.warning(self, "Error", "La clave debe ser un número entero.")
-            return
+        key = int(key_text)
 
         result, search_path = self.avl.buscar(key)
         if result is not None:
-            message = f"Clave: {result['clave']}\n"
-            message += f"Nombre: {result['nombre']}\n"
-            message += f"Cantidad: {result['cantidad']}\n"
-            message += f"Precio: {result['precio']}\n"
-            message += f"Categoría: {result['categoria']}"
+            message = f"Clave: {result.clave}\n"
+            message += f"Nombre: {result.nombre}\n"
+            message += f"Cantidad: {result.cantidad}\n"
+            message += f"Precio: {result.precio}\n"
+            message += f"Categoría: {result.categoria}"
             QMessageBox.information(self, "Resultado de Búsqueda", message)
             
             # Resaltar el camino de búsqueda
@@ -746,6 +1209,27 @@ class MainWindow(QMainWindow):
         self.search_key_input.clear()
 
 
+    def request_update(self):
+        """
+        Programa una actualización de la interfaz de usuario.
+
+        En lugar de redibujar en el momento, marca la interfaz como pendiente y agenda
+        una sola llamada a `update_ui` para cuando el bucle de eventos quede libre; varias
+        modificaciones seguidas producen un único redibujo.
+        """
+        if not self._ui_dirty:
+            self._ui_dirty = True
+            QTimer.singleShot(0, self._flush_ui)
+
+
+    def _flush_ui(self):
+        """
+        Ejecuta la actualización de la interfaz programada por `request_update`.
+        """
+        self._ui_dirty = False
+        self.update_ui()
+
+
     def update_ui(self):
         """
         Actualiza la interfaz de usuario.
@@ -755,23 +1239,16 @@ class MainWindow(QMainWindow):
 
         Widgets involucrados:
         - self.tree_view: Vista del árbol AVL.
-        - self.inventory_list: Lista de inventario.
+        - self.inventory_list: Lista de inventario (vista de self.inventory_model).
 
         Pasos:
         1. Actualiza la visualización del árbol.
-        2. Limpia la lista de inventario.
-        3. Realiza un recorrido in-order del árbol AVL.
-        4. Agrega cada producto del recorrido a la lista de inventario.
+        2. Realiza un recorrido in-order del árbol AVL.
+        3. Reemplaza los productos del modelo del inventario; la vista solo pide el
+           texto de las filas visibles.
         """
         self.tree_view.update_tree()
-        self.inventory_list.clear()
-        in_order = self.avl.in_order_traversal()
-        for producto in in_order:
-            self.inventory_list.addItem(
-                f"Clave: {producto['clave']}, Nombre: {producto['nombre']}, "
-                f"Cantidad: {producto['cantidad']}, Precio: {producto['precio']}, "
-                f"Categoría: {producto['categoria']}"
-            )
+        self.inventory_model.set_products(self.avl.in_order_traversal())
             
             
     def handle_rotation(self, tipo_rotacion, clave_y, clave_x):
@@ -794,12 +1271,26 @@ class MainWindow(QMainWindow):
         1. Crea un evento de rotación con los parámetros proporcionados.
         2. Agrega el evento de rotación a la visualización del árbol.
         3. Crea un mensaje descriptivo de la rotación.
-        4. Agrega el mensaje a la lista de rotaciones.
+        4. Deja el mensaje pendiente; las rotaciones que llegan seguidas se agregan
+           juntas a la lista de rotaciones en `flush_rotations`.
         """
         event = (tipo_rotacion, clave_y, clave_x)
         self.tree_view.add_rotation_event(event)
         mensaje = f"Rotación {'Derecha' if tipo_rotacion == 'rotacion_derecha' else 'Izquierda'}: y={clave_y} ↦ x={clave_x}"
-        self.rotation_list.addItem(mensaje)
+        if not self.pending_rotations:
+            QTimer.singleShot(0, self.flush_rotations)
+        self.pending_rotations.append(mensaje)
+
+
+    def flush_rotations(self):
+        """
+        Agrega a la lista de rotaciones los mensajes pendientes con una sola llamada.
+
+        Widgets involucrados:
+        - self.rotation_list: Lista de rotaciones.
+        """
+        mensajes, self.pending_rotations = self.pending_rotations, []
+        self.rotation_list.addItems(mensajes)
         
         
     def load_json(self):
@@ -814,20 +1305,69 @@ class MainWindow(QMainWindow):
 
         Pasos:
         1. Abre un diálogo para seleccionar el archivo JSON.
-        2. Llama al método `cargar_desde_json` del árbol AVL para cargar los datos.
-        3. Actualiza la interfaz de usuario.
-        4. Muestra un mensaje de éxito o error según el resultado de la carga.
+        2. Lee el archivo en un hilo del `QThreadPool` (`JsonLoadWorker`), sin bloquear
+           la interfaz.
+        3. Al terminar la lectura, `on_json_read` agrega los datos al árbol, actualiza la
+           interfaz y muestra un mensaje de éxito o error.
         """
         file_name, _ = QFileDialog.getOpenFileName(self, "Cargar archivo JSON", "", "JSON Files (*.json)")
         if file_name:
-            try:
-                self.avl.cargar_desde_json(file_name)
-                self.update_ui()
-                QMessageBox.information(self, "Éxito", "Datos cargados correctamente desde JSON.")
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Error al cargar el archivo JSON: {str(e)}")
+            worker = JsonLoadWorker(self.avl, file_name)
+            worker.signals.finished.connect(self.on_json_read)
+            worker.signals.failed.connect(self.on_json_failed)
+            # Conservar las señales hasta que lleguen al hilo de la interfaz
+            self.json_load_signals = worker.signals
+            QThreadPool.globalInstance().start(worker)
+
+
+    def on_json_read(self, file_name, datos):
+        """
+        Agrega al árbol AVL los productos leídos por `JsonLoadWorker`.
+
+        Se ejecuta en el hilo de la interfaz, así que el árbol y los widgets solo se
+        modifican desde ese hilo.
+
+        Parámetros:
+        - file_name: Ruta del archivo leído.
+        - datos: Lista de productos leídos del archivo.
+        """
+        try:
+            self.avl.cargar_datos(datos, file_name)
+            self.request_update()
+            QMessageBox.information(self, "Éxito", "Datos cargados correctamente desde JSON.")
+        except Exception as e:
+            self.on_json_failed(file_name, str(e))
+
+
+    def on_json_failed(self, file_name, error):
+        """
+        Informa un error al cargar un archivo JSON.
+
+        Parámetros:
+        - file_name: Ruta del archivo que se intentó cargar.
+        - error: Mensaje del error.
+        """
+        QMessageBox.warning(self, "Error", f"Error al cargar el archivo JSON: {error}")
                 
                 
+    def closeEvent(self, event):
+        """
+        Deja el archivo JSON al día antes de cerrar la ventana.
+
+        Los cambios de la sesión pueden estar solo en el journal del archivo; al cerrar
+        se escriben en la instantánea completa. Si la escritura falla se avisa y la
+        ventana se cierra igual: el journal conserva los cambios.
+
+        Parámetros:
+        - event: Evento de cierre de la ventana.
+        """
+        try:
+            self.avl.compactar_journal()
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error al guardar el archivo JSON: {str(e)}")
+        super().closeEvent(event)
+
+
     def save_json(self):
         """
         Guarda datos en un archivo JSON.
@@ -878,12 +1418,13 @@ class MainWindow(QMainWindow):
         6. Muestra los productos encontrados o un mensaje de error si no se encuentran.
         7. Limpia los campos de texto.
         """
-        try:
-            min_price = float(self.min_price_input.text())
-            max_price = float(self.max_price_input.text())
-        except ValueError:
+        min_text = self.min_price_input.text()
+        max_text = self.max_price_input.text()
+        if not min_text or not max_text:
             QMessageBox.warning(self, "Error", "Por favor, ingrese valores numéricos válidos para los precios.")
             return
+        min_price = float(min_text)
+        max_price = float(max_text)
 
         if min_price > max_price:
             QMessageBox.warning(self, "Error", "El precio mínimo no puede ser mayor que el precio máximo.")
@@ -892,12 +1433,14 @@ class MainWindow(QMainWindow):
         results, search_path = self.avl.buscar_por_rango_precios(min_price, max_price)
         self.tree_view.highlight_search_path(search_path)
 
-        if results:
-            result_text = "Productos encontrados:\n\n"
-            for producto in results:
-                result_text += f"Clave: {producto['clave']}, Nombre: {producto['nombre']}, "
-                result_text += f"Precio: {producto['precio']}, Cantidad: {producto['cantidad']}, "
-                result_text += f"Categoría: {producto['categoria']}\n\n"
+        if len(results) > MAX_MESSAGE_RESULTS:
+            ResultsDialog("Resultados de Búsqueda", "Productos encontrados:", results, self).exec_()
+        elif results:
+            result_text = "Productos encontrados:\n\n" + "".join(
+                f"Clave: {producto.clave}, Nombre: {producto.nombre}, "
+                f"Precio: {producto.precio}, Cantidad: {producto.cantidad}, "
+                f"Categoría: {producto.categoria}\n\n"
+                for producto in results)
             
             QMessageBox.information(self, "Resultados de Búsqueda", result_text)
         else:
@@ -927,11 +1470,14 @@ class MainWindow(QMainWindow):
         results, search_path = self.avl.buscar_por_categoria(categoria)
         self.tree_view.highlight_search_path(search_path)
 
-        if results:
-            result_text = f"Productos en la categoría '{categoria}':\n\n"
-            for producto in results:
-                result_text += f"ID: {producto['clave']}, Nombre: {producto['nombre']}, "
-                result_text += f"Precio: {producto['precio']}, Cantidad: {producto['cantidad']}\n\n"
+        if len(results) > MAX_MESSAGE_RESULTS:
+            ResultsDialog("Resultados de Búsqueda por Categoría",
+                          f"Productos en la categoría '{categoria}':", results, self).exec_()
+        elif results:
+            result_text = f"Productos en la categoría '{categoria}':\n\n" + "".join(
+                f"ID: {producto.clave}, Nombre: {producto.nombre}, "
+                f"Precio: {producto.precio}, Cantidad: {producto.cantidad}\n\n"
+                for producto in results)
             
             QMessageBox.information(self, "Resultados de Búsqueda por Categoría", result_text)
         else:
@@ -958,31 +1504,30 @@ class MainWindow(QMainWindow):
         4. Resalta el camino de búsqueda en la visualización del árbol.
         5. Muestra los productos encontrados o un mensaje de error si no se encuentran.
         """
-        try:
-            precio_min = float(self.combined_min_price_input.text()) if self.combined_min_price_input.text() else None
-            precio_max = float(self.combined_max_price_input.text()) if self.combined_max_price_input.text() else None
-            categoria = self.combined_category_combo.currentText()
-            categoria = None if categoria == "Todas" else categoria
-
-            results, search_path = self.avl.busqueda_combinada(precio_min, precio_max, categoria)
+        precio_min = float(self.combined_min_price_input.text()) if self.combined_min_price_input.text() else None
+        precio_max = float(self.combined_max_price_input.text()) if self.combined_max_price_input.text() else None
+        categoria = self.combined_category_combo.currentText()
+        categoria = None if categoria == "Todas" else categoria
 
-            # Resaltar el camino de búsqueda en la visualización
-            self.tree_view.highlight_search_path(search_path)
+        results, search_path = self.avl.busqueda_combinada(precio_min, precio_max, categoria)
 
-            if results:
-                result_text = "Resultados de la búsqueda combinada:\n\n"
-                for producto in results:
-                    result_text += f"ID: {producto['clave']}, Nombre: {producto['nombre']}, "
-                    result_text += f"Precio: {producto['precio']}, Cantidad: {producto['cantidad']}, "
-                    result_text += f"Categoría: {producto['categoria']}\n\n"
-                
-                QMessageBox.information(self, "Resultados de Búsqueda Combinada", result_text)
-            else:
-                QMessageBox.information(self, "Resultados de Búsqueda Combinada", 
-                                        "No se encontraron productos que cumplan con los criterios especificados.")
+        # Resaltar el camino de búsqueda en la visualización
+        self.tree_view.highlight_search_path(search_path)
 
-        except ValueError:
-            QMessageBox.warning(self, "Error", "Por favor, ingrese valores numéricos válidos para los precios.")
+        if len(results) > MAX_MESSAGE_RESULTS:
+            ResultsDialog("Resultados de Búsqueda Combinada",
+                          "Resultados de la búsqueda combinada:", results, self).exec_()
+        elif results:
+            result_text = "Resultados de la búsqueda combinada:\n\n" + "".join(
+                f"ID: {producto.clave}, Nombre: {producto.nombre}, "
+                f"Precio: {producto.precio}, Cantidad: {producto.cantidad}, "
+                f"Categoría: {producto.categoria}\n\n"
+                for producto in results)
+            
+            QMessageBox.information(self, "Resultados de Búsqueda Combinada", result_text)
+        else:
+            QMessageBox.information(self, "Resultados de Búsqueda Combinada", 
+                                    "No se encontraron productos que cumplan con los criterios especificados.")
 
     # Agregar un método para limpiar la visualización del camino de búsqueda
     def clear_search_visualization(self):